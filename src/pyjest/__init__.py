@@ -1,8 +1,21 @@
 """Public exports for PyJest."""
 
-from .assertions import expect, expect_async
+from .assertions import assert_equal, assert_is, assert_none, assert_truthy, expect, expect_async
 from .discovery import mark_pyjest, marked_modules
 from .labels import autolabel, describe, test
 from .main import main
 
-__all__ = ["expect", "expect_async", "mark_pyjest", "marked_modules", "main", "describe", "test", "autolabel"]
+__all__ = [
+    "expect",
+    "expect_async",
+    "assert_equal",
+    "assert_is",
+    "assert_truthy",
+    "assert_none",
+    "mark_pyjest",
+    "marked_modules",
+    "main",
+    "describe",
+    "test",
+    "autolabel",
+]
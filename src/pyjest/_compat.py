@@ -0,0 +1,8 @@
+"""Small shims for features that differ across supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+
+# ``@dataclass(slots=True)`` only exists on 3.10+; fall back to regular dataclasses on 3.9.
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
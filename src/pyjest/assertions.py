@@ -2,79 +2,212 @@
 
 from __future__ import annotations
 
-import asyncio
 import difflib
+import math
 import pprint
+from itertools import islice
 import re
-from dataclasses import dataclass
-from typing import Any, Iterable, Mapping
+import reprlib
+from functools import lru_cache
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Mapping
 
+from ._compat import DATACLASS_SLOTS
 from .snapshot import STORE
-from .colors import BRIGHT_CYAN, BRIGHT_GREEN, BRIGHT_RED, DIM, RESET, color
+from .colors import BRIGHT_CYAN, BRIGHT_GREEN, BRIGHT_RED, DIM, RESET
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DiffConfig:
     max_lines: int | None = 200
     color: bool = True
+    full_repr: bool = False
+    # Upper bound on len(left) * len(right), the matcher's worst-case comparison grid.
+    max_diff_cells: int | None = 5_000_000
 
 
 DIFF_CONFIG = DiffConfig()
 
 
-def configure_diffs(max_lines: int | None, color: bool) -> None:
+def configure_diffs(
+    max_lines: int | None, color: bool, full_repr: bool = False, max_diff_cells: int | None = 5_000_000
+) -> None:
     max_lines = None if max_lines is not None and max_lines <= 0 else max_lines
+    max_diff_cells = None if max_diff_cells is not None and max_diff_cells <= 0 else max_diff_cells
     DIFF_CONFIG.max_lines = max_lines
     DIFF_CONFIG.color = color
+    DIFF_CONFIG.full_repr = full_repr
+    DIFF_CONFIG.max_diff_cells = max_diff_cells
+
+
+_REPR = reprlib.Repr()
+_REPR.maxlevel = 6
+_REPR.maxtuple = _REPR.maxlist = _REPR.maxarray = _REPR.maxdeque = 50
+_REPR.maxdict = _REPR.maxset = _REPR.maxfrozenset = 50
+_REPR.maxstring = _REPR.maxlong = _REPR.maxother = 200
 
 
 def _pretty(value: Any) -> str:
+    if DIFF_CONFIG.full_repr:
+        return _full_pretty(value)
+    return _REPR.repr(value)
+
+
+def _full_pretty(value: Any) -> str:
     return pprint.pformat(value, width=80, compact=True)
 
 
+def _pretty_pair(expected: Any, actual: Any, full: tuple[str, str] | None = None) -> tuple[str, str]:
+    """Header forms of both values; ``full`` is their pprint output when the caller already has it."""
+    if isinstance(expected, str) and isinstance(actual, str):
+        # The diff already shows the raw lines; the header only needs a quoted one-liner.
+        if DIFF_CONFIG.full_repr:
+            return repr(expected), repr(actual)
+        return _REPR.repr(expected), _REPR.repr(actual)
+    if DIFF_CONFIG.full_repr:
+        return full or (_full_pretty(expected), _full_pretty(actual))
+    pair = (_REPR.repr(expected), _REPR.repr(actual))
+    if pair[0] == pair[1]:
+        # The bounded repr elided the difference; show everything rather than two identical lines.
+        pair = full or (_full_pretty(expected), _full_pretty(actual))
+    return pair
+
+
+_unified_diff = difflib.unified_diff
+# Expectations in loops and parameterized tests reuse the same few patterns.
+_compile = lru_cache(maxsize=1024)(re.compile)
+
+
 def _diff(expected: Any, actual: Any) -> str:
-    left, right = _normalize_diff_inputs(expected, actual)
-    lines = list(difflib.ndiff(left, right))
-    lines = _maybe_truncate(lines)
+    return _diff_lines(*_normalize_diff_inputs(expected, actual))
+
+
+def _diff_lines(left: list[str], right: list[str]) -> str:
+    if left == right:
+        return "(values repr equal; __eq__ disagrees)"
+    max_lines = _diff_line_budget(len(left), len(right))
+    clipped = max_lines is not None and (len(left) > max_lines or len(right) > max_lines)
+    if clipped and left[:max_lines] == right[:max_lines]:
+        # The visible slices match, so a hunk would be empty; point at the first difference instead.
+        lines = _first_difference(left, right, max_lines)
+    else:
+        if clipped:
+            # Lines past the display budget can never be shown, so keep them out of the matcher too.
+            left, right = left[:max_lines], right[:max_lines]
+        # Skip the ---/+++ file header; hunks start at "@@".
+        lines = _take_lines(islice(_unified_diff(left, right, lineterm="", n=3), 2, None))
+        if clipped and not (lines and lines[-1].startswith("... (")):
+            lines.append(f"... (diff limited to the first {max_lines} lines of each value)")
     if not DIFF_CONFIG.color:
         return "\n".join(lines)
-    return "\n".join(_colorize_diff_line(line) for line in lines)
+    colors = _DIFF_LINE_COLORS
+    return "\n".join(f"{colors.get(line[:1], DIM)}{line}{RESET}" for line in lines)
 
 
-def _normalize_diff_inputs(expected: Any, actual: Any) -> tuple[list[str], list[str]]:
-    if isinstance(expected, str) and isinstance(actual, str):
-        return expected.splitlines(), actual.splitlines()
-    return _pretty(expected).splitlines(), _pretty(actual).splitlines()
+def _first_difference(left: list[str], right: list[str], max_lines: int) -> list[str]:
+    index = next((i for i, (a, b) in enumerate(zip(left, right)) if a != b), min(len(left), len(right)))
+    lines = [f"... (first {max_lines} lines match; values first differ at line {index + 1})"]
+    if index < len(left):
+        lines.append(f"-{left[index]}")
+    if index < len(right):
+        lines.append(f"+{right[index]}")
+    return lines
 
 
-def _maybe_truncate(lines: list[str]) -> list[str]:
+def _diff_line_budget(left_len: int, right_len: int) -> int | None:
+    """Lines per side to diff: the display limit, tightened when the pair would exceed ``max_diff_cells``."""
     max_lines = DIFF_CONFIG.max_lines
-    if max_lines is None or len(lines) <= max_lines:
-        return lines
-    head = lines[: max_lines - 1]
-    head.append(f"... ({len(lines) - len(head)} more lines truncated)")
+    max_cells = DIFF_CONFIG.max_diff_cells
+    if max_cells is None or left_len * right_len <= max_cells:
+        return max_lines
+    side = max(1, math.isqrt(max_cells))
+    return side if max_lines is None else min(max_lines, side)
+
+
+def _normalize_diff_inputs(expected: Any, actual: Any) -> tuple[list[str], list[str]]:
+    if isinstance(expected, str) and isinstance(actual, str):
+        left, right = expected.splitlines(), actual.splitlines()
+        if left == right:
+            # Only line endings differ; quote each line with its terminator so the diff can show it.
+            left = [repr(line) for line in expected.splitlines(keepends=True)]
+            right = [repr(line) for line in actual.splitlines(keepends=True)]
+        return left, right
+    # The bounded repr is a single line; pprint's layout lets hunks point at the differing item.
+    return _full_pretty(expected).splitlines(), _full_pretty(actual).splitlines()
+
+
+def _take_lines(lines: Iterator[str]) -> list[str]:
+    """Materialize at most ``max_lines`` lines, ending with a marker when the stream had more."""
+    max_lines = DIFF_CONFIG.max_lines
+    if max_lines is None:
+        return list(lines)
+    head = list(islice(lines, max_lines))
+    rest = sum(1 for _ in lines)
+    if rest:
+        head[-1] = f"... ({rest + 1} more lines truncated)"
     return head
 
 
-def _colorize_diff_line(line: str) -> str:
-    if line.startswith("+"):
-        return color(line, BRIGHT_GREEN)
-    if line.startswith("-"):
-        return color(line, BRIGHT_RED)
-    if line.startswith("?"):
-        return color(line, BRIGHT_CYAN)
-    return color(line, DIM)
+# Keyed by a diff line's first character; context lines fall back to DIM.
+_DIFF_LINE_COLORS = {"+": BRIGHT_GREEN, "-": BRIGHT_RED, "@": BRIGHT_CYAN}
+
+
+class _LazyAssertionError(AssertionError):
+    """``to_equal`` failure that formats its pretty-printed values and diff only when rendered."""
+
+    def __init__(self, expected: Any, actual: Any) -> None:
+        super().__init__(expected, actual)
+        self.expected = expected
+        self.actual = actual
+        self._message: str | None = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            if isinstance(self.expected, str) and isinstance(self.actual, str):
+                pretty = _pretty_pair(self.expected, self.actual)
+                diff = _diff(self.expected, self.actual)
+            else:
+                # pprint each value once; the header reuses it whenever it needs the full form.
+                full = (_full_pretty(self.expected), _full_pretty(self.actual))
+                pretty = _pretty_pair(self.expected, self.actual, full)
+                diff = _diff_lines(full[0].splitlines(), full[1].splitlines())
+            self._message = (
+                f"Expected values to be equal.\nExpected: {pretty[0]}\nReceived: {pretty[1]}\nDiff:\n{diff}"
+            )
+        return self._message
 
 
 def expect(value: Any) -> "Expectation":
     return Expectation(value)
 
 
+# Allocation-free forms of the hottest matchers; the Expectation methods delegate to these.
+def assert_equal(actual: Any, expected: Any) -> None:
+    if actual != expected:
+        raise _LazyAssertionError(expected, actual)
+
+
+def assert_is(actual: Any, expected: Any) -> None:
+    if actual is not expected:
+        raise AssertionError(f"Expected objects to be identical.\nExpected: {id(expected)}\nReceived: {id(actual)}")
+
+
+def assert_truthy(actual: Any) -> None:
+    if not actual:
+        raise AssertionError("Expected value to be truthy, but it was falsy.")
+
+
+def assert_none(actual: Any) -> None:
+    if actual is not None:
+        raise AssertionError(f"Expected None, received: {_pretty(actual)}")
+
+
 def expect_async(awaitable) -> "AsyncExpectation":
     return AsyncExpectation(awaitable)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Expectation:
     value: Any
 
@@ -82,26 +215,20 @@ class Expectation:
         raise AssertionError(message)
 
     def to_equal(self, expected: Any) -> None:
-        if self.value != expected:
-            message = f"Expected values to be equal.\nExpected: {_pretty(expected)}\nReceived: {_pretty(self.value)}"
-            message += f"\nDiff:\n{_diff(expected, self.value)}"
-            self._fail(message)
+        assert_equal(self.value, expected)
 
     def to_be(self, expected: Any) -> None:
-        if self.value is not expected:
-            self._fail(f"Expected objects to be identical.\nExpected: {id(expected)}\nReceived: {id(self.value)}")
+        assert_is(self.value, expected)
 
     def to_be_truthy(self) -> None:
-        if not self.value:
-            self._fail("Expected value to be truthy, but it was falsy.")
+        assert_truthy(self.value)
 
     def to_be_falsy(self) -> None:
         if self.value:
             self._fail("Expected value to be falsy, but it was truthy.")
 
     def to_be_none(self) -> None:
-        if self.value is not None:
-            self._fail(f"Expected None, received: {_pretty(self.value)}")
+        assert_none(self.value)
 
     def to_be_instance_of(self, cls: type) -> None:
         if not isinstance(self.value, cls):
@@ -128,14 +255,15 @@ class Expectation:
     def to_match(self, pattern: str | re.Pattern[str]) -> None:
         if not isinstance(self.value, str):
             self._fail(f"to_match requires a string value, received {type(self.value).__name__}")
-        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        regex = _compile(pattern) if isinstance(pattern, str) else pattern
         if not regex.search(self.value):  # type: ignore[arg-type]
             self._fail(f"Expected string to match {regex.pattern!r}, received {self.value!r}")
 
     def to_have_keys(self, keys: Iterable[Any]) -> None:
         if not isinstance(self.value, Mapping):
             self._fail(f"to_have_keys requires a mapping, received {type(self.value).__name__}")
-        missing = [key for key in keys if key not in self.value]  # type: ignore[operator]
+        present = self.value.keys()  # type: ignore[union-attr]
+        missing = [key for key in keys if key not in present]
         if missing:
             self._fail(f"Missing keys: {_pretty(missing)} in {_pretty(self.value)}")
 
@@ -144,7 +272,7 @@ class Expectation:
         try:
             self.value()
         except exc_type as exc:
-            if match and not re.search(match, str(exc)):
+            if match and not _compile(match).search(str(exc)):
                 self._fail(f"Expected exception message to match {match!r}, received {str(exc)!r}")
             return
         except Exception as exc:
@@ -160,23 +288,27 @@ class Expectation:
             self._fail("to_raise requires a callable value")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AsyncExpectation:
     awaitable: Any
+    _is_coro: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._is_coro = isinstance(self.awaitable, Coroutine)
 
     async def to_resolve_to(self, expected: Any) -> None:
-        if not asyncio.iscoroutine(self.awaitable):
+        if not self._is_coro:
             raise AssertionError("to_resolve_to requires an awaitable value")
         actual = await self.awaitable
         Expectation(actual).to_equal(expected)
 
     async def to_raise(self, exc_type: type[BaseException] = Exception, match: str | None = None) -> None:
-        if not asyncio.iscoroutine(self.awaitable):
+        if not self._is_coro:
             raise AssertionError("to_raise requires an awaitable value")
         try:
             await self.awaitable
         except exc_type as exc:
-            if match and not re.search(match, str(exc)):
+            if match and not _compile(match).search(str(exc)):
                 raise AssertionError(
                     f"Expected exception message to match {match!r}, received {str(exc)!r}"
                 ) from exc
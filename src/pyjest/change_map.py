@@ -2,22 +2,30 @@
 
 from __future__ import annotations
 
+import ast
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from typing import Iterable, Mapping, Sequence
 
-from .discovery import _module_name_from_path
+from . import discovery
+from .discovery import _TEST_FILE_SUFFIXES, _module_name_from_path
 
+# path -> (mtime_ns, top-level imports); watch ticks only re-parse files that changed.
+_IMPORT_CACHE: dict[str, tuple[int, set[str]]] = {}
 
-def _import_graph_from_modules(modules: Iterable[str]) -> Mapping[str, set[str]]:
-    """Return a shallow import graph mapping module -> direct imports."""
+
+def _import_graph_from_modules(modules: Iterable[str], root: Path | None = None) -> Mapping[str, set[str]]:
+    """Return a shallow import graph mapping module -> direct imports, for modules under ``root``."""
+    root_prefix = os.path.join(os.path.abspath(root or discovery.PROJECT_ROOT), "")
     graph: dict[str, set[str]] = {}
-    for name in modules:
+    for name in list(modules):
         module = sys.modules.get(name)
-        if not module or not getattr(module, "__file__", None):
+        path = getattr(module, "__file__", None) if module else None
+        if not path or not os.path.abspath(path).startswith(root_prefix):
             continue
-        deps = _read_imports(module.__file__)
+        deps = _read_imports(path)
         if deps:
             graph[name] = deps
     return graph
@@ -25,14 +33,12 @@ def _import_graph_from_modules(modules: Iterable[str]) -> Mapping[str, set[str]]
 
 def infer_targets_from_changes(changed: set[Path], default_targets: Sequence[str]) -> list[str]:
     """Try to pick targets based on changed files and loaded modules."""
-    targets = set()
-    for path in changed:
-        if path.suffix in {".py", ".pyj", ".pyjest"}:
-            targets.add(_module_name_from_path(path))
+    names = {path: _module_name_from_path(path) for path in changed}
+    targets = {names[path] for path in changed if path.name.endswith(_TEST_FILE_SUFFIXES)}
     # If we saw only non-test files, map to modules that import them (best-effort).
     if not targets:
         graph = _import_graph_from_modules(sys.modules.keys())
-        changed_modules = {_module_name_from_path(path) for path in changed}
+        changed_modules = set(names.values())
         for mod, deps in graph.items():
             if any(dep in changed_modules for dep in deps):
                 targets.add(mod)
@@ -40,12 +46,71 @@ def infer_targets_from_changes(changed: set[Path], default_targets: Sequence[str
 
 
 def _read_imports(path_str: str) -> set[str]:
+    try:
+        mtime = os.stat(path_str).st_mtime_ns
+    except OSError:
+        return set()
+    cached = _IMPORT_CACHE.get(path_str)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    deps = _parse_imports(path_str)
+    _IMPORT_CACHE[path_str] = (mtime, deps)
+    return deps
+
+
+def _parse_imports(path_str: str) -> set[str]:
+    try:
+        with open(path_str, "rb") as fh:
+            tree = ast.parse(fh.read(), filename=path_str)
+    except SyntaxError:
+        return _scan_import_lines(path_str)
+    except (OSError, ValueError):
+        return set()
+    deps: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            deps.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            deps.add(node.module.split(".")[0])
+    return deps
+
+
+_IMPORT_SCAN_SLACK = 50
+
+
+def _scan_import_lines(path_str: str) -> set[str]:
+    """Line-based fallback for sources ``ast`` cannot parse.
+
+    Imports sit at the top of a module, so the scan stops after a run of
+    ``_IMPORT_SCAN_SLACK`` code lines without one. Blank lines, comments and
+    docstrings do not count towards the run.
+    """
     deps: set[str] = set()
+    non_import_run = 0
+    docstring_quote: str | None = None
     try:
         with open(path_str, "r") as fh:
             for line in fh:
                 line = line.strip()
-                deps.update(_parse_import_line(line))
+                if docstring_quote:
+                    if docstring_quote in line:
+                        docstring_quote = None
+                    continue
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith(('"""', "'''")):
+                    quote = line[:3]
+                    if line.count(quote) == 1:
+                        docstring_quote = quote
+                    continue
+                found = _parse_import_line(line)
+                if found:
+                    deps.update(found)
+                    non_import_run = 0
+                    continue
+                non_import_run += 1
+                if non_import_run >= _IMPORT_SCAN_SLACK:
+                    break
     except OSError:
         return set()
     return deps
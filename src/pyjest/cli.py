@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import argparse
+import functools
 from pathlib import Path
 from typing import Sequence
 
 
 def parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    args = _build_parser().parse_args(argv)
+    # The parser is shared, so list defaults must not be handed out (and later appended to) by reference.
+    for key, value in vars(args).items():
+        if isinstance(value, list):
+            setattr(args, key, list(value))
+    return args
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run the test suite with Jest-style output."
     )
@@ -18,7 +29,7 @@ def parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
     _add_reporting_args(parser)
     _add_diff_args(parser)
     parser.add_argument("--buffer", "--buf", action="store_true", help="Buffer stdout/stderr during tests")
-    return parser.parse_args(argv)
+    return parser
 
 
 def _add_watch_args(parser: argparse.ArgumentParser) -> None:
@@ -42,6 +53,12 @@ def _add_watch_args(parser: argparse.ArgumentParser) -> None:
         default=0.2,
         help="Extra debounce delay after a change is detected (default: %(default)s)",
     )
+    parser.add_argument(
+        "--force-poll",
+        "--fp",
+        action="store_true",
+        help="In watch mode, poll the filesystem even when watchfiles/watchdog is installed",
+    )
     parser.add_argument(
         "--run-failures-first",
         "--rff",
@@ -64,7 +81,7 @@ def _add_watch_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--watch-quiet",
         action="store_true",
-        help="Reduce watch-mode chatter (suppress change notices and failure tips)",
+        help="Reduce watch-mode chatter (suppress change notices, failure tips and the per-run coverage table)",
     )
 
 
@@ -145,6 +162,18 @@ def _add_execution_args(parser: argparse.ArgumentParser) -> None:
         default=1,
         help="Maximum workers (reserved; currently must be 1)",
     )
+    parser.add_argument(
+        "--parallel-stream",
+        "--pst",
+        action="store_true",
+        help="Let parallel workers print labelled lines as they run instead of one block per worker",
+    )
+    parser.add_argument(
+        "--affinity",
+        default=None,
+        metavar="CPUS[:N]",
+        help="Pin parallel workers round-robin to CPUs, e.g. 0-7 (one CPU each) or 0-7:2 (pairs)",
+    )
     parser.add_argument(
         "--updateSnapshot",
         "--us",
@@ -300,4 +329,16 @@ def _add_diff_args(parser: argparse.ArgumentParser) -> None:
         dest="color_diffs",
         help="Disable colorized inline diffs",
     )
+    parser.add_argument(
+        "--full-repr",
+        action="store_true",
+        help="Pretty-print complete values in assertion failures instead of a bounded repr",
+    )
+    parser.add_argument(
+        "--max-diff-cells",
+        "--mdc",
+        type=int,
+        default=5_000_000,
+        help="Clip both sides of a diff when their line counts multiply past this (0 = unlimited)",
+    )
     parser.set_defaults(color_diffs=True)
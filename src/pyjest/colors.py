@@ -1,5 +1,10 @@
 """ANSI color helpers used across PyJest."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable
+
 RESET = "\033[0m"
 BOLD = "\033[1m"
 DIM = "\033[2m"
@@ -17,5 +22,15 @@ BRIGHT_YELLOW = "\033[93m"
 BRIGHT_CYAN = "\033[96m"
 
 
-def color(text: str, color_code: str) -> str:
-    return f"{color_code}{text}{RESET}"
+def color(text: str, color_code: str, _reset: str = RESET) -> str:
+    return color_code + text + _reset
+
+
+@lru_cache(maxsize=None)
+def _colorize(color_code: str) -> Callable[[str], str]:
+    """Return a one-argument painter for a hot color code."""
+
+    def paint(text: str, _code: str = color_code, _reset: str = RESET) -> str:
+        return _code + text + _reset
+
+    return paint
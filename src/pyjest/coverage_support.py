@@ -2,28 +2,43 @@
 
 from __future__ import annotations
 
-import io
 import builtins
+import heapq
 import importlib
+import operator
 import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 import json
 
+from ._compat import DATACLASS_SLOTS
 from .colors import BRIGHT_GREEN, BRIGHT_RED, BRIGHT_YELLOW, color
 
 
+@dataclass(**DATACLASS_SLOTS)
+class FileStat:
+    filename: str
+    percent: float
+
+
 def make_coverage(root: Path):
     coverage_module = _import_coverage()
     return coverage_module.Coverage(branch=True, source=[str(root)])
 
 
 def report_coverage(
-    cov: Any, html_dir: str | None, show_bars: bool = False, json_path: str | None = None
-) -> tuple[float, list[dict[str, Any]]]:
-    percent = _write_text_report(cov)
-    stats = _collect_file_stats(cov)
+    cov: Any,
+    html_dir: str | None,
+    show_bars: bool = False,
+    json_path: str | None = None,
+    quiet: bool = False,
+    keep_stats: bool = False,
+) -> tuple[float, list[FileStat]]:
+    percent = _write_text_report(cov, quiet)
+    # analysis2 re-parses every measured file; only pay for it when something reads the stats.
+    stats = _collect_file_stats(cov) if (show_bars or json_path or keep_stats) else []
     if show_bars:
         _print_file_highlights(stats)
     _maybe_write_html(cov, html_dir)
@@ -94,12 +109,12 @@ def _retry_without_c_extension(exc: Exception):
         builtins.__import__ = real_import
 
 
-def _write_text_report(cov: Any) -> float:
-    buffer = io.StringIO()
-    percent = cov.report(skip_empty=True, file=buffer)
-    report_text = buffer.getvalue().strip()
-    if report_text:
-        print(report_text)
+def _write_text_report(cov: Any, quiet: bool = False) -> float:
+    if quiet:
+        # The total is still needed for thresholds; only the table is dropped.
+        with open(os.devnull, "w") as sink:
+            return float(cov.report(skip_empty=True, file=sink))
+    percent = cov.report(skip_empty=True, file=sys.stdout)
     return float(percent)
 
 
@@ -111,35 +126,36 @@ def _maybe_write_html(cov: Any, html_dir: str | None) -> None:
     print(f"HTML coverage report written to {output_dir}")
 
 
-def _maybe_write_json(percent: float, stats: list[dict[str, Any]], json_path: str | None) -> None:
+def _maybe_write_json(percent: float, stats: list[FileStat], json_path: str | None) -> None:
     if not json_path:
         return
-    payload = {"summary": {"coverage": percent}, "files": stats}
+    files = [{"filename": stat.filename, "percent": stat.percent} for stat in stats]
+    payload = {"summary": {"coverage": percent}, "files": files}
     path = Path(json_path).resolve()
     path.write_text(json.dumps(payload, indent=2))
     print(f"JSON coverage report written to {path}")
 
 
-def _print_file_highlights(stats: list[dict[str, Any]], width: int = 20) -> None:
+def _print_file_highlights(stats: list[FileStat], width: int = 20) -> None:
     if not stats:
         return
-    stats_sorted = sorted(stats, key=lambda item: item["percent"], reverse=True)
-    top = stats_sorted[:3]
-    bottom = stats_sorted[-3:]
+    by_percent = operator.attrgetter("percent")
+    top = heapq.nlargest(3, stats, key=by_percent)
+    bottom = heapq.nsmallest(3, stats, key=by_percent)
     print("Coverage file highlights:")
     seen: set[str] = set()
-    for entry in top + bottom:
-        key = entry["filename"]
+    for entry in top + bottom[::-1]:
+        key = entry.filename
         if key in seen:
             continue
         seen.add(key)
-        bar = _render_bar(entry["percent"], width)
-        print(f"  {bar} {entry['percent']:6.2f}% {entry['filename']}")
+        bar = _render_bar(entry.percent, width)
+        print(f"  {bar} {entry.percent:6.2f}% {entry.filename}")
 
 
-def _collect_file_stats(cov: Any) -> list[dict[str, Any]]:
+def _collect_file_stats(cov: Any) -> list[FileStat]:
     data = cov.get_data()
-    stats: list[dict[str, Any]] = []
+    stats: list[FileStat] = []
     for filename in sorted(data.measured_files()):
         try:
             _, statements, missing, _, _ = cov.analysis2(filename)
@@ -149,14 +165,20 @@ def _collect_file_stats(cov: Any) -> list[dict[str, Any]]:
             continue
         covered = len(statements) - len(missing)
         percent = (covered / len(statements)) * 100 if statements else 0.0
-        stats.append({"filename": filename, "percent": percent})
+        stats.append(FileStat(filename, percent))
     return stats
 
 
+# Every bar of a given width, indexed by its filled cell count.
+_BAR_CACHE: dict[int, list[str]] = {}
+
+
 def _render_bar(percent: float, width: int) -> str:
     filled = max(0, min(width, int((percent / 100.0) * width)))
-    empty = width - filled
-    bar = "█" * filled + "░" * empty
+    bars = _BAR_CACHE.get(width)
+    if bars is None:
+        bars = _BAR_CACHE[width] = ["█" * f + "░" * (width - f) for f in range(width + 1)]
+    bar = bars[filled]
     if percent >= 90:
         clr = BRIGHT_GREEN
     elif percent >= 70:
@@ -3,19 +3,32 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 import importlib.util
 from importlib.machinery import SourceFileLoader
-import inspect
+import marshal
 import os
 import re
 import sys
 import unittest
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from types import ModuleType
+
+    # (plain suffixes, fused glob regex) built once per run by ``_compile_excludes``.
+    _Excludes = tuple[tuple[str, ...], "re.Pattern[str] | None"]
 
 
 PROJECT_ROOT = Path.cwd()
 PYJEST_SUFFIXES = {".pyjest", ".pyj"}
+_PYJEST_SUFFIX_TUPLE = tuple(PYJEST_SUFFIXES)
+_TEST_FILE_SUFFIXES = (".py", *_PYJEST_SUFFIX_TUPLE)
+_SKIP_DIRS = frozenset({".git", ".hg", ".svn", "__pycache__", ".venv", "venv", "node_modules"})
+_GLOB_CHARS = frozenset("*?[")
+_VALID_MODULE_NAME = re.compile(r"[_a-z]\w*\.py$", re.IGNORECASE)
 
 
 def _set_project_root(root: Path) -> None:
@@ -24,20 +37,36 @@ def _set_project_root(root: Path) -> None:
     PROJECT_ROOT = root.resolve()
     if str(PROJECT_ROOT) not in sys.path:
         sys.path.insert(0, str(PROJECT_ROOT))
+    # Cached displays are relative to the previous root.
+    _module_display.cache_clear()
+    _cached_module_name.cache_clear()
+    _DIRS_WITH_TESTS.clear()
+    # Module names are relative to the root.
+    _PYJEST_MODULE_CACHE.clear()
+    _MODULE_FILES.clear()
+    _forget_layout()
 
 
-_set_project_root(PROJECT_ROOT)
+def _forget_layout() -> None:
+    """Drop cached layout probes and directory enumerations after files are added or removed."""
+    _LAYOUT_CACHE.clear()
 
 
 _MARKED_MODULES: set[str] = set()
+_DIRS_WITH_TESTS: set[str] = set()
+_PYJEST_MODULE_CACHE: dict[str, tuple[tuple[int, int], ModuleType]] = {}
+_MODULE_FILES: dict[str, str] = {}
+# Walk results that only change when files appear or disappear; watch mode clears them on such changes.
+_LAYOUT_CACHE: dict[tuple, Any] = {}
 
 
 def mark_pyjest(module: str | None = None) -> None:
     """Record that a module expects to run under PyJest."""
     if module is None:
-        frame = inspect.currentframe()
-        caller = frame.f_back if frame else None
-        module = caller.f_globals.get("__name__", "<unknown>") if caller else "<unknown>"
+        try:
+            module = sys._getframe(1).f_globals.get("__name__", "<unknown>")
+        except ValueError:
+            module = "<unknown>"
     _MARKED_MODULES.add(module)
 
 
@@ -46,10 +75,13 @@ def marked_modules() -> tuple[str, ...]:
     return tuple(sorted(_MARKED_MODULES))
 
 
+@functools.lru_cache(maxsize=1024)
 def _doc_summary(doc: str | None) -> str | None:
     if not doc:
         return None
-    cleaned = inspect.cleandoc(doc).strip()
+    from inspect import cleandoc
+
+    cleaned = cleandoc(doc).strip()
     if not cleaned:
         return None
     for line in cleaned.splitlines():
@@ -59,11 +91,13 @@ def _doc_summary(doc: str | None) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _module_display(module_name: str) -> tuple[str, str | None]:
     module = sys.modules.get(module_name)
     doc_title = _doc_summary(getattr(module, "__doc__", None)) if module else None
-    if module and hasattr(module, "__file__") and module.__file__:
-        path = Path(module.__file__).resolve()
+    module_file = _module_file(module_name)
+    if module_file:
+        path = Path(module_file)
         try:
             rel = path.relative_to(PROJECT_ROOT)
             return str(rel), doc_title
@@ -101,19 +135,39 @@ def _format_test_title(test: unittest.case.TestCase) -> str:
     return raw.strip()
 
 
-def _pyjest_matches_pattern(path: Path, pattern: str) -> bool:
-    """Return True if a .pyjest/.pyj file logically matches the discovery pattern."""
-    pretend_py = path.with_suffix(".py").name
-    return fnmatch.fnmatch(pretend_py, pattern)
+def _first_pattern_index(name: str, patterns: Sequence[str]) -> int | None:
+    """Index of the first glob in ``patterns`` matching ``name`` (fnmatch semantics), or None."""
+    name = os.path.normcase(name)
+    if len(patterns) == 1 and patterns[0] == "test*.py":
+        # The default glob is a prefix/suffix check; skip the regex engine.
+        return 0 if name.startswith("test") and name.endswith(".py") else None
+    match = _patterns_regex(tuple(patterns)).match(name)
+    if match is None:
+        return None
+    groups = match.groupdict()
+    return next(index for index in range(len(patterns)) if groups[f"_p{index}"] is not None)
+
+
+@functools.lru_cache(maxsize=8)
+def _patterns_regex(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    # One alternation for all discovery globs; alternatives are tried in order, so the
+    # first named group that participated is the first pattern that matches.
+    return re.compile(
+        "|".join(f"(?P<_p{index}>{fnmatch.translate(os.path.normcase(p))})" for index, p in enumerate(patterns))
+    )
 
 
 def _auto_patterns(pattern: str, root: Path) -> list[str]:
     """Expand default pattern to include pytest/Django variants if present."""
     patterns = [pattern]
     if pattern == "test*.py":
-        if any(root.rglob("*_test.py")):
+        key = ("probe", str(root))
+        if key not in _LAYOUT_CACHE:
+            _LAYOUT_CACHE[key] = _probe_test_layouts(root)
+        has_suffix_tests, has_tests_py = _LAYOUT_CACHE[key]
+        if has_suffix_tests:
             patterns.append("*_test.py")
-        if (root / "manage.py").exists() or any(root.rglob("tests.py")):
+        if has_tests_py or (root / "manage.py").exists():
             patterns.append("tests.py")
     # Deduplicate while preserving order
     seen = set()
@@ -126,52 +180,217 @@ def _auto_patterns(pattern: str, root: Path) -> list[str]:
     return unique
 
 
+def _probe_test_layouts(root: Path) -> tuple[bool, bool]:
+    """Report whether ``root`` holds ``*_test.py`` / ``tests.py`` files, in one walk that stops once both are seen."""
+    has_suffix_tests = has_tests_py = False
+    for entry in _scan_files(root, (".py",)):
+        name = entry.name
+        has_suffix_tests = has_suffix_tests or name.endswith("_test.py")
+        has_tests_py = has_tests_py or name == "tests.py"
+        if has_suffix_tests and has_tests_py:
+            break
+    return has_suffix_tests, has_tests_py
+
+
 def _load_tests_from_pyjest_file(loader: unittest.TestLoader, path: Path) -> unittest.TestSuite:
+    return loader.loadTestsFromModule(_pyjest_module(path))
+
+
+def _pyjest_module(path: Path) -> ModuleType:
+    """Execute a ``.pyj``/``.pyjest`` file, reusing the module while the file is unchanged (watch reruns)."""
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _PYJEST_MODULE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     module_name = _module_name_from_path(path)
-    loader_obj = SourceFileLoader(module_name, str(path))
+    loader_obj = _PyjestSourceLoader(module_name, str(path))
     spec = importlib.util.spec_from_loader(module_name, loader_obj)
     if spec is None:
         raise ImportError(f"Cannot import PyJest test module from {path}")
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
     loader_obj.exec_module(module)
-    return loader.loadTestsFromModule(module)
+    _PYJEST_MODULE_CACHE[key] = (stamp, module)
+    return module
 
 
-def _discover_pyjest_files(loader: unittest.TestLoader, directory: Path, pattern: str) -> list[unittest.TestSuite]:
-    suites: list[unittest.TestSuite] = []
-    for root, _, files in os.walk(directory):
-        for name in files:
-            if not any(name.endswith(suffix) for suffix in PYJEST_SUFFIXES):
-                continue
-            path = Path(root) / name
-            if not _pyjest_matches_pattern(path, pattern):
-                continue
-            suites.append(_load_tests_from_pyjest_file(loader, path))
-    return suites
+class _PyjestSourceLoader(SourceFileLoader):
+    """Source loader that caches ``.pyj``/``.pyjest`` bytecode under its own name.
 
+    The stock loader maps ``foo.pyjest`` and a sibling ``foo.py`` to the same ``.pyc`` and keeps
+    invalidating one with the other; this one writes ``foo.pyjest.<tag>.pyc``, validated by source hash.
+    """
 
-def _load_directory_suite(
-    loader: unittest.TestLoader,
+    def get_code(self, fullname: str):
+        source_path = self.get_filename(fullname)
+        source = self.get_data(source_path)
+        cache_path = _pyjest_cache_path(source_path)
+        if cache_path is None:
+            return self.source_to_code(source, source_path)
+        source_hash = importlib.util.source_hash(source)
+        code = _read_cached_code(cache_path, source_hash)
+        if code is None:
+            code = self.source_to_code(source, source_path)
+            if not sys.dont_write_bytecode:
+                _write_cached_code(cache_path, code, source_hash)
+        return code
+
+
+_HASH_PYC_FLAGS = (0b11).to_bytes(4, "little")  # PEP 552 checked hash-based pyc
+
+
+def _pyjest_cache_path(source_path: str) -> Path | None:
+    tag = sys.implementation.cache_tag
+    if tag is None:
+        return None
+    source = Path(source_path)
+    return source.parent / "__pycache__" / f"{source.name}.{tag}.pyc"
+
+
+def _read_cached_code(cache_path: Path, source_hash: bytes):
+    try:
+        data = cache_path.read_bytes()
+    except OSError:
+        return None
+    header = importlib.util.MAGIC_NUMBER + _HASH_PYC_FLAGS + source_hash
+    if not data.startswith(header):
+        return None
+    try:
+        return marshal.loads(data[len(header):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_cached_code(cache_path: Path, code, source_hash: bytes) -> None:
+    import tempfile
+
+    payload = importlib.util.MAGIC_NUMBER + _HASH_PYC_FLAGS + source_hash + marshal.dumps(code)
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        # A read-only tree just means no cache.
+        return
+
+
+def _scan_pyjest(directory: Path) -> list[Path]:
+    """Return every ``.pyj``/``.pyjest`` file below ``directory`` in walk order."""
+    return [Path(entry.path) for entry in _scan_files(directory, _PYJEST_SUFFIX_TUPLE)]
+
+
+def _scan_files(directory: Path, suffixes: tuple[str, ...] | None = None) -> Iterable[os.DirEntry[str]]:
+    """Yield regular files below ``directory`` with an ``os.scandir`` walk, skipping VCS/venv/cache dirs.
+
+    With ``suffixes``, only files whose names end with one of them are yielded.
+    """
+    stack = [str(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif (suffixes is None or entry.name.endswith(suffixes)) and entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _enumerate_test_modules(
     directory: Path,
-    pattern: str,
+    patterns: Sequence[str],
     *,
     include_standard: bool = True,
     include_pyjest: bool = True,
-) -> unittest.TestSuite:
-    suites: list[unittest.TestSuite] = []
+    workers: int = 1,
+) -> list[str]:
+    """Return loadable targets for every test file under ``directory`` without importing them.
+
+    Standard ``.py`` tests are named the way ``loader.discover`` names them (dotted, relative to
+    ``directory``, descending only into packages); ``.pyj``/``.pyjest`` files are returned as paths.
+    With ``workers > 1`` the top-level entries are walked concurrently; the order is unchanged.
+    """
+    # One walk per file kind for all patterns; each file lands in the bucket of the first pattern
+    # it matches, so the result keeps the old per-pattern order without re-walking per pattern.
+    standard: list[list[str]] = [[] for _ in patterns]
+    pyjest: list[list[str]] = [[] for _ in patterns]
     if include_standard:
-        suites.append(loader.discover(str(directory), pattern=pattern))
+        pool = None
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for name, index in _standard_modules(directory, patterns, pool):
+                standard[index].append(name)
+        finally:
+            if pool is not None:
+                pool.shutdown()
     if include_pyjest:
-        suites.extend(_discover_pyjest_files(loader, directory, pattern))
-    return unittest.TestSuite(suites)
+        for path in _scan_pyjest(directory):
+            index = _first_match(path, patterns)
+            if index is not None:
+                pyjest[index].append(str(path))
+    found: dict[str, None] = {}
+    for names, paths in zip(standard, pyjest):
+        found.update(dict.fromkeys(names))
+        found.update(dict.fromkeys(sorted(paths)))
+    return list(found)
+
+
+def _first_match(path: Path, patterns: Sequence[str]) -> int | None:
+    # .pyj/.pyjest files match as if they were the equivalent .py file.
+    return _first_pattern_index(f"{path.stem}.py", patterns)
+
+
+def _standard_modules(
+    directory: Path, patterns: Sequence[str], pool: ThreadPoolExecutor | None
+) -> list[tuple[str, int]]:
+    if pool is None:
+        return list(_iter_standard_modules(directory, directory, patterns))
+    entries = sorted(directory.iterdir())
+    chunks = pool.map(lambda entry: _standard_entry_modules(directory, entry, patterns), entries)
+    return [item for chunk in chunks for item in chunk]
+
+
+def _iter_standard_modules(top_level: Path, directory: Path, patterns: Sequence[str]) -> Iterable[tuple[str, int]]:
+    for entry in sorted(directory.iterdir()):
+        yield from _standard_entry_modules(top_level, entry, patterns)
+
+
+def _standard_entry_modules(top_level: Path, entry: Path, patterns: Sequence[str]) -> list[tuple[str, int]]:
+    if entry.is_dir():
+        if (entry / "__init__.py").is_file():
+            return list(_iter_standard_modules(top_level, entry, patterns))
+        return []
+    if not _VALID_MODULE_NAME.match(entry.name):
+        return []
+    index = _first_pattern_index(entry.name, patterns)
+    if index is None:
+        return []
+    return [(".".join(entry.relative_to(top_level).with_suffix("").parts), index)]
+
+
+_PROJECT_MARKERS = frozenset({"pyproject.toml", "setup.cfg", "setup.py", "requirements.txt"})
 
 
 def _is_python_project(root: Path) -> bool:
-    markers = ["pyproject.toml", "setup.cfg", "setup.py", "requirements.txt"]
-    if any((root / marker).exists() for marker in markers):
-        return True
-    return any(root.glob("*.py"))
+    try:
+        with os.scandir(root) as it:
+            return any(entry.name in _PROJECT_MARKERS or entry.name.endswith(".py") for entry in it)
+    except OSError:
+        return False
 
 
 def _ensure_python_project(root: Path) -> None:
@@ -184,13 +403,17 @@ def _ensure_python_project(root: Path) -> None:
 
 
 def _module_name_from_path(path: Path) -> str:
-    rel = path.resolve()
+    return _cached_module_name(os.path.abspath(path), str(PROJECT_ROOT))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_module_name(path: str, root: str) -> str:
+    resolved = Path(path).resolve()
     try:
-        rel = rel.relative_to(PROJECT_ROOT)
+        rel = resolved.relative_to(root)
     except ValueError:
-        return path.stem
-    module = ".".join(rel.with_suffix("").parts)
-    return module
+        return Path(path).stem
+    return ".".join(rel.with_suffix("").parts)
 
 
 def _load_targets(
@@ -207,13 +430,21 @@ def _load_targets(
     tags: Sequence[str] | None = None,
 ) -> unittest.TestSuite:
     targets = _default_targets_if_empty(targets)
-    patterns = _auto_patterns(pattern, PROJECT_ROOT)
-    exclude_patterns = tuple(pattern_exclude or ())
-    ignore_paths = tuple((PROJECT_ROOT / Path(p)).resolve() for p in (ignores or ()))
-    suites: list[unittest.TestSuite] = []
+    # Probing for pytest/Django layouts walks the whole root; module and test-id targets never need it.
+    patterns: list[str] | None = None
+    exclude_patterns = _compile_excludes(tuple(pattern_exclude or ()))
+    ignore_paths = tuple(str((PROJECT_ROOT / Path(p)).resolve()) for p in (ignores or ()))
+    tests: dict[str, unittest.case.TestCase] = {}
+    seen_targets: set[str] = set()
     for target in targets:
+        target_key = _target_key(target)
+        if target_key in seen_targets:
+            continue
+        seen_targets.add(target_key)
+        if patterns is None and os.path.isdir(target):
+            patterns = _auto_patterns(pattern, PROJECT_ROOT)
         suite = _load_single_target(
-            loader, target, patterns, include_standard=include_standard, include_pyjest=include_pyjest
+            loader, target, patterns or [pattern], include_standard=include_standard, include_pyjest=include_pyjest
         )
         suite = _filter_suite(
             suite,
@@ -224,15 +455,27 @@ def _load_targets(
             tags=tags or (),
         )
         suite = _apply_only_filter(suite)
-        suites.append(suite)
-    return unittest.TestSuite(suites)
+        # Overlapping targets (a directory plus a module inside it) keep the first copy of each test.
+        for test in _flatten_suite(suite):
+            tests.setdefault(test.id(), test)
+    # One flat suite: no nested iterator frames per test at run time, same order as the traversal.
+    return unittest.TestSuite(tests.values())
+
+
+def _target_key(target: str) -> str:
+    path = Path(target)
+    return str(path.resolve()) if path.exists() else target
 
 
 def _has_test_files(path: Path) -> bool:
-    for root, _, files in os.walk(path):
-        for name in files:
-            if name.endswith(".py") or any(name.endswith(suffix) for suffix in PYJEST_SUFFIXES):
-                return True
+    key = os.path.abspath(path)
+    if key in _DIRS_WITH_TESTS:
+        return True
+    # The walk is lazy, so this stops at the first matching file.
+    if any(True for _ in _scan_files(path, _TEST_FILE_SUFFIXES)):
+        # Only hits are remembered: a directory that gains tests mid-watch is rechecked.
+        _DIRS_WITH_TESTS.add(key)
+        return True
     return False
 
 
@@ -273,13 +516,52 @@ def _load_directory_target(
 ) -> unittest.TestSuite:
     if not _has_test_files(path):
         raise SystemExit(f"pyjest only runs Python tests. Directory '{path}' has no .py, .pyj, or .pyjest files.")
-    suites = [
-        _load_directory_suite(
-            loader, path, pattern, include_standard=include_standard, include_pyjest=include_pyjest
+    # One enumeration for every pattern replaces a loader.discover walk plus a .pyjest walk per pattern.
+    key = ("modules", os.path.abspath(path), tuple(patterns), include_standard, include_pyjest)
+    targets = _LAYOUT_CACHE.get(key)
+    if targets is None:
+        targets = _LAYOUT_CACHE[key] = _enumerate_test_modules(
+            path, patterns, include_standard=include_standard, include_pyjest=include_pyjest
         )
-        for pattern in patterns
-    ]
-    return _merge_suites(suites)
+    top_level = str(path.resolve())
+    if include_standard and top_level not in sys.path:
+        # Standard modules are named relative to ``path``, as loader.discover would name them.
+        sys.path.insert(0, top_level)
+    return _merge_suites([_load_enumerated_target(loader, target, top_level) for target in targets])
+
+
+def _load_enumerated_target(loader: unittest.TestLoader, target: str, top_level: str) -> unittest.TestSuite:
+    if target.endswith(_PYJEST_SUFFIX_TUPLE):
+        return _load_tests_from_pyjest_file(loader, Path(target))
+    try:
+        suite = loader.loadTestsFromName(target)
+    except Exception:
+        # As in loader.discover: a module that fails to import becomes a failed test, not an aborted run.
+        failed, message = unittest.loader._make_failed_import_test(target, loader.suiteClass)
+        loader.errors.append(message)
+        return failed
+    mismatch = _module_origin_mismatch(target, os.path.join(top_level, *target.split(".")) + ".py")
+    if mismatch is None:
+        return suite
+    # Same check as loader.discover: a same-named module from another directory target must not stand in.
+    failed, message = unittest.loader._make_failed_test(target, ImportError(mismatch), loader.suiteClass, mismatch)
+    loader.errors.append(message)
+    return failed
+
+
+def _module_origin_mismatch(name: str, expected: str) -> str | None:
+    module = sys.modules.get(name)
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return None
+    actual = os.path.splitext(os.path.realpath(module_file))[0]
+    wanted = os.path.splitext(os.path.realpath(expected))[0]
+    if os.path.normcase(actual) == os.path.normcase(wanted):
+        return None
+    return (
+        f"{name!r} module incorrectly imported from {os.path.dirname(actual)!r}. "
+        f"Expected {os.path.dirname(wanted)!r}. Is this module globally installed?"
+    )
 
 
 def _load_file_target(
@@ -303,47 +585,61 @@ def _load_file_target(
 
 
 def _merge_suites(suites: Sequence[unittest.TestSuite]) -> unittest.TestSuite:
-    tests: list[unittest.case.TestCase] = []
-    seen_ids: set[str] = set()
+    # Insertion-ordered dict: one hash per test id, first copy wins.
+    tests: dict[str, unittest.case.TestCase] = {}
+    add = tests.setdefault
     for suite in suites:
         for test in _iter_tests(suite):
-            tid = test.id()
-            if tid in seen_ids:
-                continue
-            seen_ids.add(tid)
-            tests.append(test)
-    return unittest.TestSuite(tests)
+            add(test.id(), test)
+    return unittest.TestSuite(tests.values())
+
+
+def _flatten_suite(suite: unittest.TestSuite) -> list[unittest.case.TestCase]:
+    return list(_iter_tests(suite))
 
 
 def _iter_tests(suite: unittest.TestSuite) -> Iterable[unittest.case.TestCase]:
-    for test in suite:
-        if isinstance(test, unittest.TestSuite):
-            yield from _iter_tests(test)
-        else:
+    # Explicit stack of suite iterators: no nested generator frame per suite level.
+    stack = [iter(suite)]
+    while stack:
+        for test in stack[-1]:
+            if isinstance(test, unittest.TestSuite):
+                stack.append(iter(test))
+                break
             yield test
+        else:
+            stack.pop()
 
 
 def _filter_suite(
     suite: unittest.TestSuite,
-    excludes: Sequence[str],
-    ignores: Sequence[Path],
+    excludes: _Excludes,
+    ignores: Sequence[str],
     *,
     test_name_pattern: re.Pattern[str] | None,
     module_pattern: str | None,
     tags: Sequence[str],
 ) -> unittest.TestSuite:
-    if not excludes and not ignores:
-        # continue to tag/name/module filtering below
-        pass
+    check_paths = bool(excludes[0] or excludes[1] or ignores)
+    check_modules = check_paths or bool(module_pattern)
+    root = str(PROJECT_ROOT)
+    # Path and module filters depend only on the test's module: decide once per module.
+    module_kept: dict[str, bool] = {}
     filtered: list[unittest.case.TestCase] = []
     for test in _iter_tests(suite):
-        path = _test_file(test)
-        if path and _should_exclude(path, excludes, ignores):
-            continue
+        if check_modules:
+            module_name = test.__class__.__module__
+            kept = module_kept.get(module_name)
+            if kept is None:
+                path = _test_file_str(test) if check_paths else None
+                kept = not (path and _should_exclude(path, excludes, ignores, root))
+                if kept and module_pattern:
+                    kept = _matches_module(test, module_pattern)
+                module_kept[module_name] = kept
+            if not kept:
+                continue
         if test_name_pattern and not _matches_test_name(test, test_name_pattern):
             continue
-        if module_pattern and not _matches_module(test, module_pattern):
-            continue
         if tags and not _matches_tags(test, tags):
             continue
         filtered.append(test)
@@ -372,31 +668,42 @@ def _apply_only_filter(suite: unittest.TestSuite) -> unittest.TestSuite:
 
 
 def _test_file(test: unittest.case.TestCase) -> Path | None:
-    module = sys.modules.get(test.__class__.__module__)
-    if module and getattr(module, "__file__", None):
-        return Path(module.__file__).resolve()
-    return None
+    path = _test_file_str(test)
+    return Path(path) if path else None
 
 
-def _should_exclude(path: Path, excludes: Sequence[str], ignores: Sequence[Path]) -> bool:
-    rel = None
-    try:
-        rel = path.relative_to(PROJECT_ROOT)
-    except ValueError:
-        rel = path
-    rel_str = str(rel)
-    if any(rel_str.endswith(pattern) or fnmatch.fnmatch(rel_str, pattern) for pattern in excludes):
+def _test_file_str(test: unittest.case.TestCase) -> str | None:
+    return _module_file(test.__class__.__module__)
+
+
+def _module_file(module_name: str) -> str | None:
+    """Resolved ``__file__`` of a loaded module, looked up and resolved once per module."""
+    path = _MODULE_FILES.get(module_name)
+    if path is None:
+        module = sys.modules.get(module_name)
+        if not module or not getattr(module, "__file__", None):
+            # Not cached: the module may simply not be imported yet.
+            return None
+        path = _MODULE_FILES[module_name] = os.path.realpath(module.__file__)
+    return path
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_excludes(patterns: tuple[str, ...]) -> _Excludes:
+    """Split ``--exclude`` patterns into plain suffixes and one regex for the globs."""
+    suffixes = tuple(p for p in patterns if not _GLOB_CHARS.intersection(p))
+    globs = [os.path.normcase(p) for p in patterns if _GLOB_CHARS.intersection(p)]
+    regex = re.compile("|".join(fnmatch.translate(p) for p in globs)) if globs else None
+    return suffixes, regex
+
+
+def _should_exclude(path: str, excludes: _Excludes, ignores: Sequence[str], root: str) -> bool:
+    """String-only check of a resolved test file against ``--exclude`` patterns and ``--ignore`` dirs."""
+    rel_str = path[len(root) + 1 :] if path.startswith(root + os.sep) else path
+    suffixes, regex = excludes
+    if (suffixes and rel_str.endswith(suffixes)) or (regex and regex.match(os.path.normcase(rel_str))):
         return True
-    for ignore in ignores:
-        try:
-            rel_ignore = rel if rel else path
-            if rel_ignore.is_relative_to(ignore):
-                return True
-        except AttributeError:
-            # Python < 3.9 compatibility fallback
-            if str(rel_ignore).startswith(str(ignore)):
-                return True
-    return False
+    return any(path == ignore or path.startswith(ignore + os.sep) for ignore in ignores)
 
 
 def _matches_test_name(test: unittest.case.TestCase, pattern: re.Pattern[str]) -> bool:
@@ -413,3 +720,6 @@ def _matches_tags(test: unittest.case.TestCase, tags: Sequence[str]) -> bool:
     cls_label = getattr(test.__class__, "__pyjest_describe__", "") or ""
     haystack = f"{label} {cls_label}".lower()
     return all(tag.lower() in haystack for tag in tags)
+
+
+_set_project_root(PROJECT_ROOT)
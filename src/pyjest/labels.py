@@ -96,14 +96,15 @@ def autolabel(
     a prefix (e.g., ``test_``), replace ``_`` with spaces, and optionally title-case.
     """
 
+    # Built once per decorator rather than once per labelled method.
+    prefixes = (strip_prefix,) if isinstance(strip_prefix, str) else tuple(strip_prefix or ())
+
     def default_transform(name: str) -> str:
         working = name
-        if strip_prefix:
-            prefixes = (strip_prefix,) if isinstance(strip_prefix, str) else tuple(strip_prefix)
-            for prefix in prefixes:
-                if working.startswith(prefix):
-                    working = working[len(prefix) :]
-                    break
+        for prefix in prefixes:
+            if working.startswith(prefix):
+                working = working[len(prefix) :]
+                break
         working = working.replace("_", " ")
         return working.title() if title_case else working
 
@@ -5,20 +5,23 @@ from __future__ import annotations
 import sys
 from typing import Sequence
 
-from .assertions import expect, expect_async
 from .cli import parse_args
-from .discovery import mark_pyjest, marked_modules
 from .orchestrator.env import prepare_environment
-from .orchestrator.run_once import run_once
-from .orchestrator.watch_loop import run_watch
 
-__all__ = ["expect", "expect_async", "mark_pyjest", "marked_modules", "main"]
+__all__ = ["main"]
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = _prepare_args(argv)
     prepare_environment(args)
-    return run_once(args) if not args.watch else run_watch(args)
+    # Only the selected mode's pipeline is imported; watch mode pulls in the file watchers.
+    if args.watch:
+        from .orchestrator.watch_loop import run_watch
+
+        return run_watch(args)
+    from .orchestrator.run_once import run_once
+
+    return run_once(args)
 
 
 def _prepare_args(argv: Sequence[str] | None) -> object:
@@ -35,6 +38,7 @@ def _prepare_args(argv: Sequence[str] | None) -> object:
     if args.coverage_json is not None:
         args.coverage = True
     args.coverage_threshold_module = _parse_module_thresholds(args.coverage_threshold_module)
+    args.affinity = _parse_affinity(args.affinity) if args.affinity else None
     if "console" not in args.report_format:
         args.report_format.append("console")
     return args
@@ -43,16 +47,31 @@ def _prepare_args(argv: Sequence[str] | None) -> object:
 def _parse_module_thresholds(entries: Sequence[str]) -> dict[str, float]:
     parsed: dict[str, float] = {}
     for entry in entries:
-        if "=" not in entry:
+        name, sep, pct_str = entry.partition("=")
+        if not sep:
             raise SystemExit(f"--coverage-threshold-module must be NAME=PCT, got: {entry}")
-        name, pct_str = entry.split("=", 1)
         try:
-            pct = float(pct_str)
+            parsed[name] = float(pct_str)
         except ValueError:
             raise SystemExit(f"--coverage-threshold-module percent must be a number, got: {pct_str}") from None
-        parsed[name] = pct
     return parsed
 
 
+def _parse_affinity(spec: str) -> list[tuple[int, ...]]:
+    """Turn ``0-3,6`` or ``[0-7]:2`` into the CPU sets handed to workers in turn."""
+    cpu_spec, _, group = spec.partition(":")
+    cpus: list[int] = []
+    try:
+        for part in cpu_spec.strip("[]").split(","):
+            first, _, last = part.partition("-")
+            cpus.extend(range(int(first), int(last or first) + 1))
+        size = int(group) if group else 1
+    except ValueError:
+        raise SystemExit(f"--affinity must look like 0-7 or 0-7:2, got: {spec}") from None
+    if not cpus or size < 1:
+        raise SystemExit(f"--affinity must name at least one CPU per worker, got: {spec}")
+    return [tuple(cpus[index : index + size]) for index in range(0, len(cpus), size)]
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
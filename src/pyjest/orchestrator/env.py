@@ -5,14 +5,16 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-from ..discovery import _ensure_python_project, _set_project_root
+from .. import discovery
+from ..discovery import _ensure_python_project, _forget_layout, _set_project_root
 from ..assertions import configure_diffs
 from ..snapshot import STORE as SNAPSHOTS
 
 
 def prepare_environment(args) -> None:
     requested_root = args.root
-    root = (requested_root or Path.cwd()).expanduser().resolve()
+    # getcwd() already returns the canonical path; only a user-supplied root needs resolving.
+    root = requested_root.expanduser().resolve() if requested_root else Path.cwd()
     if requested_root:
         if not root.exists():
             raise SystemExit(f"--root path not found: {root}")
@@ -20,11 +22,25 @@ def prepare_environment(args) -> None:
             raise SystemExit(f"--root must be a directory: {root}")
         os.chdir(root)
     args.root = root
-    _set_project_root(root)
-    SNAPSHOTS.configure(root=root, update=args.updateSnapshot, show_summary=args.snapshot_summary)
+    # An embedding caller may have added or removed tests since a previous main() in this process.
+    _forget_layout()
+    configure_runtime(args)
     if getattr(args, "snapshot_clean", False):
         removed = SNAPSHOTS.clean_orphans()
         if removed:
             print(f"Removed {len(removed)} orphaned snapshot file(s).")
-    configure_diffs(args.max_diff_lines, args.color_diffs)
     _ensure_python_project(root)
+
+
+def configure_runtime(args) -> None:
+    """Apply the per-process settings derived from ``args`` (also used by worker processes)."""
+    # Importing discovery already set the cwd as root, and forked workers inherit the parent's: keep those caches.
+    if args.root != discovery.PROJECT_ROOT:
+        _set_project_root(args.root)
+    SNAPSHOTS.configure(root=args.root, update=args.updateSnapshot, show_summary=args.snapshot_summary)
+    configure_diffs(
+        args.max_diff_lines,
+        args.color_diffs,
+        getattr(args, "full_repr", False),
+        getattr(args, "max_diff_cells", 5_000_000),
+    )
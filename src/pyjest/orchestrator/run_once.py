@@ -6,39 +6,49 @@ import sys
 import os
 import json
 import io
-import fnmatch
+import re
 import unittest
+from dataclasses import replace
+from itertools import chain
 from pathlib import Path
-from copy import copy
 from typing import Sequence
 
 from ..coverage_support import coverage_threshold_failed
-from .runner import collect_parallel_results, run_suite, sequential_result, failing_test_ids
+from ..discovery import _auto_patterns, _enumerate_test_modules
+from .runner import (
+    WorkerConfig,
+    collect_parallel_results,
+    run_suite,
+    sequential_result,
+    failing_test_ids,
+    module_threshold_misses,
+    shared_loader,
+)
 
 LAST_FAILED_FILE = ".pyjest_lastfail"
 
 def run_once(args) -> int:
     _maybe_apply_last_failed(args)
     try:
+        if args.maxWorkers > 1:
+            shards = _shard_directory_target(args)
+            if shards:
+                labels = [f"{args.targets[0]}#{index}" for index in range(1, len(shards) + 1)]
+                return _run_parallel_targets(args, shards, labels)
         if args.maxWorkers > 1 and len(args.targets) > 1:
-            return _run_parallel_targets(args)
+            return _run_parallel_targets(args, _chunk_targets(args.targets, args.maxTargetsPerWorker))
         return _run_serial_targets(args, args.targets)
     except KeyboardInterrupt:
         return 130
 
 
-def _run_parallel_targets(args) -> int:
-    targets = _chunk_targets(args.targets, args.maxTargetsPerWorker)
-    args_targets_backup = args.targets
-    args.targets = targets
-    results, outputs = collect_parallel_results(args)
-    args.targets = args_targets_backup
+def _run_parallel_targets(args, target_groups: Sequence[Sequence[str]], labels: Sequence[str] | None = None) -> int:
+    results = collect_parallel_results(args, target_groups, labels)
     all_failing_ids: list[str] = []
     for res in results:
-        all_failing_ids.extend(failing_test_ids(res))
+        all_failing_ids.extend(res.failing_ids)
     _persist_last_failed(args.root, all_failing_ids)
     exit_fail = any(not res.wasSuccessful() for res in results)
-    _flush_outputs(outputs)
     return 0 if not exit_fail else 1
 
 
@@ -55,10 +65,25 @@ def _run_serial_targets(args, targets: Sequence[str]) -> int:
     return 0 if not exit_fail else 1
 
 
-def _flush_outputs(outputs: Sequence[str]) -> None:
-    for text in outputs:
-        if text:
-            sys.stdout.write(text)
+def _shard_directory_target(args) -> list[list[str]] | None:
+    """Split a lone directory target into per-worker module lists, or return None to run serially."""
+    if len(args.targets) != 1 or not Path(args.targets[0]).is_dir():
+        return None
+    directory = Path(args.targets[0]).resolve()
+    modules = _enumerate_test_modules(
+        directory,
+        _auto_patterns(args.pattern, args.root),
+        include_standard=not getattr(args, "pyjest_only", False),
+        workers=args.maxWorkers,
+    )
+    if len(modules) < 2:
+        return None
+    # loader.discover puts the start directory on sys.path; shards load the same names directly.
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
+    workers = min(args.maxWorkers, len(modules))
+    # Striding (rather than contiguous chunks) spreads neighbouring slow modules across workers.
+    return [modules[index::workers] for index in range(workers)]
 
 
 def _chunk_targets(targets: Sequence[str], max_per_worker: int) -> list[list[str]]:
@@ -74,7 +99,9 @@ def _maybe_apply_last_failed(args) -> None:
     if not path.exists():
         return
     try:
-        ids = json.loads(path.read_text())
+        text = path.read_text()
+        # Older releases wrote a JSON list; test ids never contain newlines, so one id per line is enough now.
+        ids = json.loads(text) if text.startswith("[") else text.splitlines()
     except Exception:
         return
     if ids:
@@ -83,8 +110,13 @@ def _maybe_apply_last_failed(args) -> None:
 
 def _persist_last_failed(root, failing_ids: Sequence[str]) -> None:
     path = root / LAST_FAILED_FILE
+    tmp = path.with_name(LAST_FAILED_FILE + ".tmp")
     try:
-        path.write_text(json.dumps(list(failing_ids)))
+        # Buffered writes retry short writes until every byte is out.
+        with open(tmp, "wb") as fh:
+            fh.write("\n".join(failing_ids).encode())
+        # Renaming over the old file means Ctrl-C mid-write never leaves a truncated list behind.
+        os.replace(tmp, path)
     except Exception:
         return
 
@@ -94,19 +126,24 @@ def _rerun_failures(args, initial_result):
     attempts = getattr(args, "rerun", 0)
     if not failing_ids or attempts <= 0:
         return initial_result
-    rerun_args = copy(args)
-    rerun_args.coverage = False
-    rerun_args.coverage_html = None
-    rerun_args.coverage_threshold = None
-    rerun_args.coverage_threshold_module = {}
-    rerun_args.coverage_json = None
-    rerun_args.report_format = ["console"]
+    rerun_args = replace(
+        WorkerConfig.from_namespace(args),
+        coverage=False,
+        coverage_html=None,
+        coverage_threshold=None,
+        coverage_threshold_module={},
+        coverage_json=None,
+        report_format=("console",),
+    )
+    loader = shared_loader()
+    rerun_result = initial_result
     for _ in range(attempts):
-        rerun_result, _, _ = run_suite(
-            unittest.TestLoader(),
+        rerun_result, _ = run_suite(
+            loader,
             rerun_args,
             failing_ids,
             stream=io.StringIO(),
+            suite=_rerun_suite(loader, rerun_result),
         )
         failing_ids = failing_test_ids(rerun_result)
         if not failing_ids:
@@ -114,23 +151,35 @@ def _rerun_failures(args, initial_result):
     return rerun_result
 
 
+_FIXTURE_SCOPE = re.compile(r"\w+ \(([\w.]+)\)")
+
+
+def _rerun_suite(loader: unittest.TestLoader, result) -> unittest.TestSuite:
+    """Rebuild a suite from the tests that failed in ``result`` without touching discovery."""
+    tests: dict[int, unittest.TestCase] = {}
+    for test, _ in chain(result.failures, result.errors):
+        # A failed subtest reruns its whole parent test, once.
+        test = getattr(test, "test_case", test)
+        tests.setdefault(id(test), test)
+    # Class/module fixture errors are _ErrorHolders described as "setUpClass (pkg.mod.Class)"; rerun that scope.
+    scopes = list(
+        dict.fromkeys(
+            match.group(1)
+            for test in tests.values()
+            if not isinstance(test, unittest.TestCase) and (match := _FIXTURE_SCOPE.fullmatch(test.id()))
+        )
+    )
+    suite = unittest.TestSuite(loader.loadTestsFromName(scope) for scope in scopes)
+    for test in tests.values():
+        # Failed tests inside a scope that is rerun whole are already part of it.
+        if isinstance(test, unittest.TestCase) and not test.id().startswith(tuple(f"{scope}." for scope in scopes)):
+            suite.addTest(test)
+    return suite
+
+
 def _modules_below_threshold(result, thresholds: dict[str, float], root: Path) -> bool:
-    if not thresholds:
-        return False
     stats = getattr(result, "_coverage_file_stats", None) or []
-    failed = False
-    for entry in stats:
-        filename = entry.get("filename")
-        percent = entry.get("percent", 0.0)
-        if not filename:
-            continue
-        try:
-            rel = Path(filename).resolve().relative_to(root)
-        except Exception:
-            rel = Path(filename)
-        module = rel.with_suffix("").as_posix().replace("/", ".")
-        for pattern, threshold in thresholds.items():
-            if fnmatch.fnmatch(module, pattern) and percent < threshold:
-                print(f"Coverage threshold not met for {module}: {percent:.2f}% < {threshold:.2f}%")
-                failed = True
-    return failed
+    misses = module_threshold_misses(stats, thresholds, root)
+    for module, percent, threshold in misses:
+        print(f"Coverage threshold not met for {module}: {percent:.2f}% < {threshold:.2f}%")
+    return bool(misses)
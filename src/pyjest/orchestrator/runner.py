@@ -2,30 +2,145 @@
 
 from __future__ import annotations
 
-import io
+import os
+import shutil
 import sys
+import tempfile
 import time
 import unittest
-from concurrent.futures import ThreadPoolExecutor
-from copy import copy
-from typing import Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Iterator, Sequence
 import re
 import fnmatch
 from pathlib import Path
 
-from ..coverage_support import coverage_threshold_failed, make_coverage, report_coverage
+from .._compat import DATACLASS_SLOTS
+from ..coverage_support import FileStat, coverage_threshold_failed, make_coverage, report_coverage
 from ..discovery import _load_targets
 from ..reporter import JestStyleTestRunner
 from ..reporting import emit_reports
+from .env import configure_runtime
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+# Set in pool workers when --parallel-stream shares the parent's stdout between them.
+_STDOUT_LOCK = None
+
+# Set in pool workers by the initializer, so each task ships only its label and targets.
+_WORKER_CONFIG: WorkerConfig | None = None
+
+# One loader per process, shared by serial runs, reruns, watch iterations and pool tasks.
+# Only each process's main thread loads tests (discovery threads just scan the filesystem), so it needs no lock.
+_LOADER = unittest.TestLoader()
+
+# Buffered worker transcripts past this size spill to disk and reach the parent as a file, not a pickled string.
+_SPOOL_LIMIT = 1 << 20
+
+
+def shared_loader() -> unittest.TestLoader:
+    return _LOADER
+
+
+@dataclass
+class SuiteSummary:
+    """Picklable digest of a suite run, returned from parallel worker processes."""
+
+    successful: bool
+    failing_ids: list[str]
+    coverage_percent: float | None
+    coverage_stats: list[FileStat] | None
+    text: str
+    text_path: str | None = None
+
+    def wasSuccessful(self) -> bool:
+        return self.successful
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class WorkerConfig:
+    """Immutable slice of the CLI namespace that worker processes actually read."""
+
+    root: Path | None = None
+    pattern: str = "test*.py"
+    pattern_exclude: tuple[str, ...] = ()
+    ignore: tuple[str, ...] = ()
+    pyjest_only: bool = False
+    testNamePattern: str | None = None
+    module_pattern: str | None = None
+    tag: tuple[str, ...] = ()
+    failfast: bool = False
+    buffer: bool = False
+    progress_fancy: int = 0
+    report_modules: bool = True
+    report_suite_table: bool = False
+    report_outliers: bool = False
+    report_format: tuple[str, ...] = ("console",)
+    report_suffix: str | None = None
+    coverage: bool = False
+    coverage_html: str | None = None
+    coverage_bars: bool = False
+    coverage_json: str | None = None
+    coverage_threshold: float | None = None
+    coverage_threshold_module: dict[str, float] | None = None
+    updateSnapshot: bool = False
+    snapshot_summary: bool = False
+    max_diff_lines: int = 200
+    color_diffs: bool = True
+    full_repr: bool = False
+    max_diff_cells: int = 5_000_000
+    affinity: tuple[tuple[int, ...], ...] | None = None
+    maxWorkers: int = 1
+    parallel_stream: bool = False
+
+    @classmethod
+    def from_namespace(cls, args) -> WorkerConfig:
+        values = {}
+        for field in fields(cls):
+            if not hasattr(args, field.name):
+                continue
+            value = getattr(args, field.name)
+            values[field.name] = tuple(value) if isinstance(value, list) else value
+        return cls(**values)
 
 
 def run_suite(
-    loader: unittest.TestLoader, args, targets: Sequence[str], stream=None
-) -> tuple[unittest.result.TestResult, float | None, str]:
-    cov = _start_coverage_if_needed(args)
+    loader: unittest.TestLoader, args, targets: Sequence[str], stream=None, cov=None, suite=None
+) -> tuple[unittest.result.TestResult, float | None]:
+    # Import failures recorded by an earlier run on a reused loader are not this run's.
+    loader.errors.clear()
     stream = stream or sys.stdout
-    test_name_pattern = re.compile(args.testNamePattern) if getattr(args, "testNamePattern", None) else None
-    suite = _load_targets(
+    with _coverage_scope(args, cov) as cov:
+        if suite is None:
+            suite = _discover_suite(loader, args, targets)
+        start = time.perf_counter()
+        result = _run_suite_with_runner(suite, stream, args)
+        duration = time.perf_counter() - start
+    coverage_percent, coverage_stats = _finish_coverage(
+        cov,
+        args.coverage_html,
+        args.coverage_bars,
+        getattr(args, "coverage_json", None),
+        quiet=_quiet_coverage(args),
+        keep_stats=bool(getattr(args, "coverage_threshold_module", None)),
+    )
+    setattr(result, "_coverage_file_stats", coverage_stats)
+    emit_reports(result, coverage_percent, duration, args)
+    return result, coverage_percent
+
+
+def _quiet_coverage(args) -> bool:
+    # --watch-quiet trims watch-mode chatter only; a plain run always prints its coverage table.
+    return bool(getattr(args, "watch", False) and getattr(args, "watch_quiet", False))
+
+
+def _discover_suite(loader: unittest.TestLoader, args, targets: Sequence[str]) -> unittest.TestSuite:
+    test_name_pattern = _compiled_pattern(args.testNamePattern) if getattr(args, "testNamePattern", None) else None
+    return _load_targets(
         loader,
         targets,
         args.pattern,
@@ -37,45 +152,61 @@ def run_suite(
         module_pattern=getattr(args, "module_pattern", None),
         tags=getattr(args, "tag", ()),
     )
-    start = time.perf_counter()
-    result = _run_suite_with_runner(suite, stream, args)
-    duration = time.perf_counter() - start
-    coverage_percent, coverage_stats = _finish_coverage(cov, args.coverage_html, args.coverage_bars, getattr(args, "coverage_json", None))
-    setattr(result, "_coverage_file_stats", coverage_stats)
-    emit_reports(result, coverage_percent, duration, args)
-    output_text = stream.getvalue() if isinstance(stream, io.StringIO) else ""
-    label = getattr(args, "report_suffix", None)
-    if label and output_text:
-        output_text = _prefix_lines(output_text, f"[{label}] ")
-    return result, coverage_percent, output_text
+
+
+@lru_cache(maxsize=32)
+def _compiled_pattern(pattern: str) -> re.Pattern[str]:
+    # Watch mode rediscovers with the same -t pattern on every change.
+    return re.compile(pattern)
 
 
 def failed_modules(result: unittest.result.TestResult) -> list[str]:
-    modules: set[str] = set()
-    failing_tests = [test for test, _ in result.failures + result.errors]  # type: ignore[operator]
-    for test in failing_tests:
-        modules.add(test.__class__.__module__)
-    return sorted(modules)
+    # A failed subtest's own class lives in unittest.case; its parent test names the real module.
+    return sorted(
+        {getattr(test, "test_case", test).__class__.__module__ for test, _ in chain(result.failures, result.errors)}
+    )
 
 
 def failing_test_ids(result: unittest.result.TestResult) -> list[str]:
-    failing_tests = [test for test, _ in result.failures + result.errors]  # type: ignore[operator]
-    return [test.id() for test in failing_tests]
+    return [test.id() for test, _ in chain(result.failures, result.errors)]
+
 
+def collect_parallel_results(
+    args, target_groups: Sequence[Sequence[str]], labels: Sequence[str] | None = None, stream=None
+) -> list[SuiteSummary]:
+    """Run each target group in a worker, writing its labelled output as soon as that worker finishes."""
+    # Process pools pull in multiprocessing and logging; only parallel runs pay for that import.
+    from concurrent.futures import ProcessPoolExecutor
 
-def collect_parallel_results(args) -> tuple[list[unittest.result.TestResult], list[str]]:
-    outputs: list[str] = []
-    results: list[unittest.result.TestResult] = []
-    pool = ThreadPoolExecutor(max_workers=args.maxWorkers)
-    futures = [_submit_parallel_task(pool, args, target_group) for target_group in args.targets]
+    stream = stream or sys.stdout
+    results: list[SuiteSummary] = []
+    config = WorkerConfig.from_namespace(args)
+    context = _pool_context()
+    pool = ProcessPoolExecutor(
+        # A forking pool starts every worker up front; never start more than there are groups to run.
+        max_workers=max(1, min(config.maxWorkers, len(target_groups))),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(
+            config,
+            context.Value("i", 0) if config.affinity else None,
+            context.Lock() if config.parallel_stream else None,
+        ),
+    )
+    labels = labels or [",".join(group) for group in target_groups]
+    futures = [
+        _submit_parallel_task(pool, target_group, label) for target_group, label in zip(target_groups, labels)
+    ]
     try:
-        for result, threshold_failed, text in _gather_results(
+        for summary, threshold_failed in _gather_results(
             futures, args.coverage_threshold, getattr(args, "coverage_threshold_module", {}), args.root
         ):
-            outputs.append(text)
+            # Only this thread writes, so whole blocks never interleave; flushing shows each one
+            # straight away even when stdout is a block-buffered pipe (CI logs, `| tee`).
+            _write_worker_output(stream, summary)
             if threshold_failed:
-                result.failures.append(("coverage", "threshold not met"))  # type: ignore[arg-type]
-            results.append(result)
+                summary.successful = False
+            results.append(summary)
     except KeyboardInterrupt:
         for future in futures:
             future.cancel()
@@ -86,13 +217,11 @@ def collect_parallel_results(args) -> tuple[list[unittest.result.TestResult], li
         raise
     else:
         pool.shutdown(wait=True)
-    return results, outputs
+    return results
 
 
 def sequential_result(args, targets: Sequence[str]) -> tuple[unittest.result.TestResult, float | None]:
-    loader = unittest.TestLoader()
-    result, coverage_percent, _ = run_suite(loader, args, targets)
-    return result, coverage_percent
+    return run_suite(_LOADER, args, targets)
 
 
 def record_watch_outcome(
@@ -101,7 +230,7 @@ def record_watch_outcome(
     last_fail = not result.wasSuccessful() or coverage_threshold_failed(coverage_percent, threshold)
     detail = None
     if result.failures or result.errors:
-        test, err = (result.failures + result.errors)[0]  # type: ignore[operator]
+        test, err = (result.failures or result.errors)[0]
         method_name = getattr(test, "_testMethodName", "")
         fn = getattr(test, method_name, None)
         label = getattr(fn, "__pyjest_test__", None) if fn else None
@@ -112,30 +241,52 @@ def record_watch_outcome(
 
 
 def _gather_results(futures, threshold: float | None, module_thresholds: dict[str, float], root: Path):
-    for future in futures:
-        result, coverage_percent, text = future.result()
-        threshold_failed = coverage_threshold_failed(coverage_percent, threshold) or _module_thresholds_failed(
-            getattr(result, "_coverage_file_stats", None) or [], module_thresholds, root
+    from concurrent.futures import as_completed
+
+    for future in as_completed(futures):
+        summary = future.result()
+        threshold_failed = coverage_threshold_failed(summary.coverage_percent, threshold) or _module_thresholds_failed(
+            summary.coverage_stats or [], module_thresholds, root
         )
-        yield result, threshold_failed, text
+        yield summary, threshold_failed
+
+
+@contextmanager
+def _coverage_scope(args, cov=None):
+    """Trace discovery and the run; the tracer comes off even when the run is interrupted."""
+    cov = _start_coverage_if_needed(args, cov)
+    try:
+        yield cov
+    finally:
+        if cov:
+            cov.stop()
 
 
-def _start_coverage_if_needed(args):
+def _start_coverage_if_needed(args, cov=None):
     if not args.coverage:
         return None
-    cov = make_coverage(args.root)
+    if cov is None:
+        cov = make_coverage(args.root)
+    else:
+        # Reused across watch iterations: drop the previous run's data instead of rebuilding.
+        cov.erase()
     cov.start()
     return cov
 
 
 def _finish_coverage(
-    cov, html_dir: str | None, show_bars: bool, json_path: str | None
-) -> tuple[float | None, list[dict] | None]:
+    cov,
+    html_dir: str | None,
+    show_bars: bool,
+    json_path: str | None,
+    *,
+    quiet: bool = False,
+    keep_stats: bool = False,
+) -> tuple[float | None, list[FileStat] | None]:
     if not cov:
         return None, None
-    cov.stop()
     cov.save()
-    percent, stats = report_coverage(cov, html_dir, show_bars, json_path)
+    percent, stats = report_coverage(cov, html_dir, show_bars, json_path, quiet, keep_stats)
     setattr(cov, "_pyjest_file_stats", stats)
     return percent, stats
 
@@ -156,38 +307,175 @@ def _run_suite_with_runner(suite: unittest.TestSuite, stream, args):
     return runner.run(suite)
 
 
-def _submit_parallel_task(pool: ThreadPoolExecutor, args, target: Sequence[str]):
-    task_args = copy(args)
-    label = ",".join(target)
-    task_args.report_suffix = label
-    return pool.submit(
-        run_suite,
-        unittest.TestLoader(),
-        task_args,
-        target,
-        io.StringIO(),
+def _pool_context():
+    import multiprocessing
+    import threading
+
+    # fork hands workers the already-imported pyjest modules; it is only safe on Linux from a single-threaded parent.
+    if sys.platform.startswith("linux") and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def _init_worker(args, slot_counter, stdout_lock=None) -> None:
+    global _STDOUT_LOCK, _WORKER_CONFIG
+    _STDOUT_LOCK = stdout_lock
+    _WORKER_CONFIG = args
+    configure_runtime(args)
+    if slot_counter is not None:
+        _pin_worker(args.affinity, slot_counter)
+
+
+def _pin_worker(cpu_sets: Sequence[Sequence[int]], slot_counter) -> None:
+    # Each worker claims the next CPU set in turn; platforms without sched_setaffinity (macOS, Windows) stay unpinned.
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    with slot_counter.get_lock():
+        slot = slot_counter.value
+        slot_counter.value += 1
+    try:
+        os.sched_setaffinity(0, cpu_sets[slot % len(cpu_sets)])
+    except OSError:
+        pass  # CPU outside this process's allowed set; run unpinned rather than fail the worker.
+
+
+def _submit_parallel_task(pool: ProcessPoolExecutor, target: Sequence[str], label: str):
+    return pool.submit(_run_suite_in_worker, label, list(target))
+
+
+def _run_suite_in_worker(label: str, targets: Sequence[str]) -> SuiteSummary:
+    # Live TestResults hold test instances that rarely pickle; ship back only what the parent reads.
+    args = replace(_WORKER_CONFIG, report_suffix=label)
+    prefix = f"[{label}] "
+    if _STDOUT_LOCK is not None:
+        stream = _LockedLineStream(sys.stdout, _STDOUT_LOCK, prefix)
+    else:
+        stream = tempfile.SpooledTemporaryFile(
+            max_size=_SPOOL_LIMIT, mode="w+", encoding="utf-8", errors="backslashreplace", newline=""
+        )
+    try:
+        result, coverage_percent = run_suite(_LOADER, args, targets, stream=stream)
+        stream.flush()
+        text, text_path = ("", None) if _STDOUT_LOCK is not None else _drain_capture(stream, prefix)
+    finally:
+        stream.close()
+    return SuiteSummary(
+        successful=result.wasSuccessful(),
+        failing_ids=failing_test_ids(result),
+        coverage_percent=coverage_percent,
+        coverage_stats=getattr(result, "_coverage_file_stats", None),
+        text=text,
+        text_path=text_path,
     )
 
 
+def _drain_capture(capture, prefix: str) -> tuple[str, str | None]:
+    """Return a worker's labelled transcript inline, or the path of a file holding it once it outgrew the spool."""
+    size = capture.tell()
+    capture.seek(0)
+    if size <= _SPOOL_LIMIT:
+        return _prefix_lines(capture.read(), prefix), None
+    # Label line by line so the transcript never sits in memory whole.
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", errors="backslashreplace", newline="", prefix="pyjest-", suffix=".log", delete=False
+    ) as spill:
+        for line in capture:
+            spill.write(line if line.isspace() else prefix + line)
+    return "", spill.name
+
+
+def _write_worker_output(stream, summary: SuiteSummary) -> None:
+    if summary.text_path:
+        try:
+            with open(summary.text_path, encoding="utf-8", newline="") as spill:
+                shutil.copyfileobj(spill, stream)
+        finally:
+            os.unlink(summary.text_path)
+    elif summary.text:
+        stream.write(summary.text)
+    else:
+        return
+    stream.flush()
+
+
+class _LockedLineStream:
+    """Write whole labelled lines to a stream shared with other worker processes."""
+
+    def __init__(self, stream, lock, prefix: str) -> None:
+        self._stream = stream
+        self._lock = lock
+        self._prefix = prefix
+        self._pending = ""
+
+    def write(self, text: str) -> int:
+        lines = (self._pending + text).splitlines(keepends=True)
+        # A trailing partial line waits for its line break so workers never split each other's lines.
+        self._pending = lines.pop() if lines and lines[-1].splitlines()[0] == lines[-1] else ""
+        if lines:
+            self._emit("".join(lines))
+        return len(text)
+
+    def flush(self) -> None:
+        # Whole lines are already out; the reporter flushes after every progress icon, and emitting
+        # the partial line here would put each icon on its own labelled line.
+        pass
+
+    def close(self) -> None:
+        # The shared stdout stays open; closing only pushes out a trailing partial line.
+        if self._pending:
+            text, self._pending = self._pending, ""
+            self._emit(text)
+
+    def _emit(self, text: str) -> None:
+        block = _prefix_lines(text, self._prefix) + "\n"
+        with self._lock:
+            self._stream.write(block)
+            self._stream.flush()
+
+
 def _prefix_lines(text: str, prefix: str) -> str:
-    return "\n".join(f"{prefix}{line}" if line.strip() else line for line in text.splitlines())
+    # isspace() tests in place where strip() copied every line; a list lets join size its buffer in one pass.
+    return "\n".join([prefix + line if line and not line.isspace() else line for line in text.splitlines()])
 
 
-def _module_thresholds_failed(stats: list[dict], thresholds: dict[str, float], root: Path) -> bool:
-    if not thresholds:
-        return False
-    failed = False
+def _module_thresholds_failed(stats: list[FileStat], thresholds: dict[str, float], root: Path) -> bool:
+    # Stop at the first miss; the caller only needs a verdict.
+    return next(_iter_threshold_misses(stats, thresholds, root), None) is not None
+
+
+def module_threshold_misses(
+    stats: Sequence[FileStat], thresholds: dict[str, float], root: Path
+) -> list[tuple[str, float, float]]:
+    """Return ``(module, percent, threshold)`` for every file under a matching per-module threshold."""
+    return list(_iter_threshold_misses(stats, thresholds, root))
+
+
+def _iter_threshold_misses(
+    stats: Sequence[FileStat], thresholds: dict[str, float], root: Path
+) -> Iterator[tuple[str, float, float]]:
+    if not thresholds or not stats:
+        return
+    matchers = _threshold_matchers(tuple(thresholds.items()))
+    root_prefix = os.path.join(str(root), "")
     for entry in stats:
-        filename = entry.get("filename")
-        percent = entry.get("percent", 0.0)
-        if not filename:
+        if not entry.filename:
             continue
-        try:
-            rel = Path(filename).resolve().relative_to(root)
-        except Exception:
-            rel = Path(filename)
-        module = rel.with_suffix("").as_posix().replace("/", ".")
-        for pattern, threshold in thresholds.items():
-            if fnmatch.fnmatch(module, pattern) and percent < threshold:
-                failed = True
-    return failed
+        module = _coverage_module_name(entry.filename, root_prefix)
+        key = os.path.normcase(module)
+        for regex, threshold in matchers:
+            if entry.percent < threshold and regex.match(key):
+                yield module, entry.percent, threshold
+
+
+@lru_cache(maxsize=8)
+def _threshold_matchers(thresholds: tuple[tuple[str, float], ...]) -> list[tuple[re.Pattern[str], float]]:
+    # Same semantics as fnmatch.fnmatch, compiled once per threshold set instead of looked up per file.
+    return [(re.compile(fnmatch.translate(os.path.normcase(pattern))), threshold) for pattern, threshold in thresholds]
+
+
+@lru_cache(maxsize=4096)
+def _coverage_module_name(filename: str, root_prefix: str) -> str:
+    # Coverage reports canonical absolute paths and the root is resolved at startup, so slicing suffices.
+    # Cached because watch mode checks the same files every iteration; the root is part of the key.
+    rel = filename[len(root_prefix) :] if filename.startswith(root_prefix) else filename
+    return os.path.splitext(rel)[0].replace(os.sep, ".")
@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import os
+import select
+import signal
+import threading
 import time
 import unittest
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Sequence
-
-from ..watch import detect_changes, snapshot_watchable_files, targets_from_changed, has_fast_watcher, next_change
+from typing import Any, Sequence
+
+from ..watch import (
+    Snapshot,
+    _refresh_snapshot,
+    has_native_debounce,
+    next_change,
+    snapshot_watchable_files,
+    targets_from_changed,
+)
 from ..change_map import infer_targets_from_changes
-from ..coverage_support import coverage_threshold_failed
-from .runner import record_watch_outcome, run_suite
+from ..coverage_support import coverage_threshold_failed, make_coverage
+from ..discovery import _forget_layout
+from .runner import record_watch_outcome, run_suite, shared_loader
+
+
+# Read end of the signal wakeup pipe; set once run_watch installs the SIGUSR1 hook.
+_WAKE_FD: int | None = None
 
 
 def run_watch(args) -> int:
+    _install_wake_signal()
     ctx = _initial_watch_context(args)
     try:
         return _watch_loop(ctx, args)
@@ -36,11 +53,15 @@ def _update_outcome(ctx: "WatchContext", args) -> None:
 
 
 def _sleep_until_change(ctx: "WatchContext", args) -> None:
+    known = set(ctx.snapshot)
     changed, snapshot = _wait_for_change(
-        ctx.snapshot, ctx.root, args.watch_interval, args.watch_debounce
+        ctx.snapshot, ctx.root, args.watch_interval, args.watch_debounce, getattr(args, "force_poll", False)
     )
     ctx.snapshot = snapshot
     ctx.last_changed = changed
+    # Edits keep the cached test layout valid; only added or removed files force a fresh walk.
+    if any(str(path) not in known or str(path) not in snapshot for path in changed):
+        _forget_layout()
 
 
 def _retarget_after_change(ctx: "WatchContext", args) -> None:
@@ -51,42 +72,82 @@ def _retarget_after_change(ctx: "WatchContext", args) -> None:
 
 def _initial_watch_context(args) -> "WatchContext":
     root = args.root
-    loader = unittest.TestLoader()
+    loader = shared_loader()
     snapshot = snapshot_watchable_files(root)
     targets = list(args.targets)
-    return WatchContext(root=root, loader=loader, snapshot=snapshot, targets=targets, quiet=getattr(args, "watch_quiet", False))
+    cov = make_coverage(root) if args.coverage else None
+    return WatchContext(
+        root=root,
+        loader=loader,
+        snapshot=snapshot,
+        targets=targets,
+        quiet=getattr(args, "watch_quiet", False),
+        cov=cov,
+    )
 
 
 def _run_watch_iteration(ctx: "WatchContext", args):
-    result, coverage_percent, _ = run_suite(ctx.loader, args, ctx.targets)
+    result, coverage_percent = run_suite(ctx.loader, args, ctx.targets, cov=ctx.cov)
     return record_watch_outcome(result, coverage_percent, args.coverage_threshold)
 
 
 def _wait_for_change(
-    snapshot: dict[Path, float], root: Path, interval: float, debounce: float
-) -> tuple[set[Path], dict[Path, float]]:
+    snapshot: Snapshot, root: Path, interval: float, debounce: float, force_poll: bool = False
+) -> tuple[set[Path], Snapshot]:
+    if not force_poll and has_native_debounce():
+        # The event backends coalesce the burst themselves; no extra sleep-and-rescan needed.
+        return next_change(snapshot, root, interval, debounce)
     changed, snapshot = _wait_until_changed(snapshot, root, interval)
     if debounce:
         changed, snapshot = _apply_debounce(changed, snapshot, root, debounce)
     return changed, snapshot
 
 
-def _wait_until_changed(snapshot: dict[Path, float], root: Path, interval: float) -> tuple[set[Path], dict[Path, float]]:
-    if has_fast_watcher():
-        return next_change(snapshot, root, interval)
+def _wait_until_changed(snapshot: Snapshot, root: Path, interval: float) -> tuple[set[Path], Snapshot]:
     changed: set[Path] = set()
+    # Rescan quickly right after a run (edits cluster), then back off to ``interval`` while idle.
+    pause = interval / 8
     while not changed:
-        changed, snapshot = detect_changes(snapshot, root)
+        changed = _refresh_snapshot(snapshot, root)
         if changed:
             break
-        time.sleep(interval)
+        pause = interval / 8 if _pause(pause) else min(pause * 2, interval)
     return changed, snapshot
 
 
-def _apply_debounce(changed: set[Path], snapshot: dict[Path, float], root: Path, debounce: float):
+def _install_wake_signal() -> None:
+    """Let ``kill -USR1 <pid>`` (e.g. from an editor hook) cut a polling pause short."""
+    global _WAKE_FD
+    sigusr1 = getattr(signal, "SIGUSR1", None)
+    if sigusr1 is None or _WAKE_FD is not None or threading.current_thread() is not threading.main_thread():
+        return
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    # The interpreter writes to the pipe from C when a signal lands, so waking never takes a lock.
+    signal.set_wakeup_fd(write_fd)
+    signal.signal(sigusr1, lambda *_: None)
+    _WAKE_FD = read_fd
+
+
+def _pause(seconds: float) -> bool:
+    """Sleep up to ``seconds``; return True when a signal woke us early."""
+    if _WAKE_FD is None:
+        time.sleep(seconds)
+        return False
+    ready, _, _ = select.select([_WAKE_FD], [], [], seconds)
+    if not ready:
+        return False
+    try:
+        os.read(_WAKE_FD, 512)
+    except BlockingIOError:
+        pass
+    return True
+
+
+def _apply_debounce(changed: set[Path], snapshot: Snapshot, root: Path, debounce: float):
     time.sleep(debounce)
-    extra, snapshot = detect_changes(snapshot, root)
-    changed |= extra
+    changed |= _refresh_snapshot(snapshot, root)
     return changed, snapshot
 
 
@@ -118,10 +179,11 @@ def _next_targets(args, changed: set[Path], failed_targets: Sequence[str]) -> li
 class WatchContext:
     root: Path
     loader: unittest.TestLoader
-    snapshot: dict[Path, float]
+    snapshot: Snapshot
     targets: list[str]
     failed_targets: list[str] = field(default_factory=list)
     last_fail: bool = False
     last_changed: set[Path] = field(default_factory=set)
     last_failure_detail: str | None = None
     quiet: bool = False
+    cov: Any = None
@@ -12,7 +12,9 @@ import signal
 import threading
 from pathlib import Path
 from typing import IO, Sequence
+from weakref import WeakKeyDictionary
 
+from ._compat import DATACLASS_SLOTS
 from .colors import (
     BG_GREEN,
     BG_RED,
@@ -27,13 +29,14 @@ from .colors import (
     GREY,
     RESET,
     YELLOW,
+    _colorize,
     color,
 )
 from .discovery import _doc_summary, _format_test_name, _module_display
 from .snapshot import print_snapshot_summary
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestDetail:
     name: str
     status: str
@@ -45,14 +48,14 @@ class TestDetail:
     cls: str | None = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClassGroup:
     name: str
     doc_title: str | None
     tests: list[TestDetail] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ModuleReport:
     key: str
     display: str
@@ -87,13 +90,10 @@ class JestStyleResult(unittest.TestResult):
         self.stream = stream
         self.descriptions = descriptions
         self.verbosity = verbosity
-        self._start_times: dict[unittest.case.TestCase, float] = {}
-        self._successes: list[unittest.case.TestCase] = []
+        # Passes are only counted; failing instances stay on the result so reruns can reuse them.
+        self.success_count = 0
         self._failures_detail: list[tuple[unittest.case.TestCase, str]] = []
         self._errors_detail: list[tuple[unittest.case.TestCase, str]] = []
-        self._skips_detail: list[tuple[unittest.case.TestCase, str]] = []
-        self._expected_failures: list[tuple[unittest.case.TestCase, str]] = []
-        self._unexpected_successes: list[unittest.case.TestCase] = []
         self._module_reports: dict[str, ModuleReport] = {}
         self._module_order: list[str] = []
         self._progress_started = False
@@ -121,10 +121,6 @@ class JestStyleResult(unittest.TestResult):
         self.progress_fancy_level: int = 0
         self.interrupted: bool = False
 
-    @property
-    def successes(self) -> Sequence[unittest.case.TestCase]:
-        return tuple(self._successes)
-
     def startTestRun(self):  # type: ignore[override]
         super().startTestRun()
         self.stream.writeln("Running tests...")
@@ -165,12 +161,12 @@ class JestStyleResult(unittest.TestResult):
         fail_count = self._progress_counts.get("FAIL", 0) + self._progress_counts.get("ERROR", 0)
         skip_count = self._progress_counts.get("SKIP", 0) + self._progress_counts.get("XF", 0)
         line = (
-            f"\r{color(spinner, BRIGHT_CYAN)} {elapsed:5.1f}s "
+            f"\r{_cyan(spinner)} {elapsed:5.1f}s "
             f"#{self._tests_seen:<3d} "
-            f"{color('✓', BRIGHT_GREEN)} {pass_count} "
-            f"{color('✕', BRIGHT_RED)} {fail_count} "
-            f"{color('↷', BRIGHT_YELLOW)} {skip_count} "
-            f"{color(module_name, DIM)} {test_title}"
+            f"{_ICON_MAP['PASS']} {pass_count} "
+            f"{_ICON_MAP['FAIL']} {fail_count} "
+            f"{_ICON_MAP['SKIP']} {skip_count} "
+            f"{_dim(module_name)} {test_title}"
         )
         padded = line.ljust(self._status_line_len or len(line))
         self._status_line_len = max(self._status_line_len, len(line))
@@ -179,7 +175,7 @@ class JestStyleResult(unittest.TestResult):
 
     def _write_progress_icon(self, status: str) -> None:
         self._write_inline_header()
-        icon = _icon_map().get(status, color("•", CYAN))
+        icon = _ICON_MAP.get(status, _DEFAULT_ICON)
         # Level 0: basic inline checkmarks with no frame.
         if self.progress_fancy_level == 0:
             self.stream.write(f"{icon}\u2009")
@@ -228,7 +224,7 @@ class JestStyleResult(unittest.TestResult):
             f"{color('#', CYAN)} {self._tests_seen:<3}"
         )
         label = (self._last_test_label or "n/a")[:24]
-        trail = "".join(_icon_map().get(s, "•") for s in self._recent_statuses[-20:])
+        trail = "".join(_ICON_MAP.get(s, "•") for s in self._recent_statuses[-20:])
         self.stream.write(f"{color('║ stats:', BRIGHT_CYAN)} {summary:<20}{color('║', BRIGHT_CYAN)}\n")
         self.stream.write(f"{color('║ trail:', BRIGHT_CYAN)} {trail:<20}{color('║', BRIGHT_CYAN)}\n")
         self.stream.write(f"{color('║ last:', BRIGHT_CYAN)}  {color(label, DIM):<20}{color('║', BRIGHT_CYAN)}\n")
@@ -262,19 +258,24 @@ class JestStyleResult(unittest.TestResult):
 
 
     def startTest(self, test):  # type: ignore[override]
-        self._start_times[test] = time.perf_counter()
+        test._pyjest_start = time.perf_counter()
         self._current_test = test
         self._tests_seen += 1
         super().startTest(test)
 
+    def stopTest(self, test):  # type: ignore[override]
+        super().stopTest(test)
+        self._current_test = None
+
     def _elapsed(self, test: unittest.case.TestCase) -> float:
-        start = self._start_times.pop(test, None)
+        # Start times live on the test itself; holders for class/module fixture errors never get one.
+        start = getattr(test, "_pyjest_start", None)
         if start is None:
             return 0.0
+        del test._pyjest_start
         return time.perf_counter() - start
 
-    def _module_report_for(self, test: unittest.case.TestCase) -> ModuleReport:
-        module_name = test.__class__.__module__
+    def _module_report_for(self, module_name: str) -> ModuleReport:
         if module_name not in self._module_reports:
             display, doc_title = _module_display(module_name)
             self._module_reports[module_name] = ModuleReport(
@@ -294,14 +295,10 @@ class JestStyleResult(unittest.TestResult):
         note: str | None = None,
         detail: str | None = None,
     ) -> None:
-        report = self._module_report_for(test)
+        module_name, class_name, class_doc_title = _class_meta(test.__class__)
+        report = self._module_report_for(module_name)
         summary = _doc_summary(getattr(test, "_testMethodDoc", None))
         title = _explicit_label(test)
-        cls = test.__class__
-        class_label = getattr(cls, "__pyjest_describe__", None)
-        class_name = class_label or cls.__name__
-        class_doc_title = class_label or _doc_summary(getattr(cls, "__doc__", None))
-        module_name = cls.__module__
         detail_obj = TestDetail(
             name=title,
             status=status,
@@ -318,36 +315,33 @@ class JestStyleResult(unittest.TestResult):
     def print_module_reports(self) -> None:
         if not (self.report_modules or self.report_suite_table or self.report_outliers):
             return
-        status_colors = _status_colors()
-        detail_colors = _detail_colors()
-        icon_map = _icon_map()
-        printed_any = False
+        out: list[str] = []
         if self.report_modules:
-            self.stream.writeln("")
+            out.append("\n")
             for module_name in self._module_order:
                 report = self._module_reports[module_name]
-                badge = _format_badge(report.headline_status, status_colors)
+                badge = _format_badge(report.headline_status)
                 display = _format_module_display(report.display)
-                self.stream.writeln(f"{badge} {display}")
+                out.append(f"{badge} {display}\n")
                 for class_name in report.group_order:
                     group = report.groups[class_name]
-                    self._print_group(group, detail_colors, icon_map)
-                    self.stream.writeln("")
-            printed_any = True
+                    self._render_group(group, out)
+                    out.append("\n")
         if self.report_suite_table and self._module_order:
-            if not printed_any:
-                self.stream.writeln("")
-            self._print_suite_table()
-            printed_any = True
+            if not out:
+                out.append("\n")
+            self._render_suite_table(out)
         if self.report_outliers and self._module_order:
-            if not printed_any:
-                self.stream.writeln("")
-            self._print_outliers()
+            if not out:
+                out.append("\n")
+            self._render_outliers(out)
+        if out:
+            self.stream.write("".join(out))
 
     def addSuccess(self, test):  # type: ignore[override]
         super().addSuccess(test)
         duration = self._elapsed(test)
-        self._successes.append(test)
+        self.success_count += 1
         self._add_detail(test, "PASS", duration)
         self._record_progress("PASS")
 
@@ -370,13 +364,11 @@ class JestStyleResult(unittest.TestResult):
     def addSkip(self, test, reason):  # type: ignore[override]
         super().addSkip(test, reason)
         duration = self._elapsed(test)
-        self._skips_detail.append((test, reason))
         self._add_detail(test, "SKIP", duration, note=reason)
         self._record_progress("SKIP")
 
     def addExpectedFailure(self, test, err):  # type: ignore[override]
         super().addExpectedFailure(test, err)
-        self._expected_failures.append((test, self._exc_info_to_string(err, test)))
         duration = self._elapsed(test)
         self._add_detail(test, "XF", duration)
         self._record_progress("XF")
@@ -384,7 +376,6 @@ class JestStyleResult(unittest.TestResult):
     def addUnexpectedSuccess(self, test):  # type: ignore[override]
         super().addUnexpectedSuccess(test)
         duration = self._elapsed(test)
-        self._unexpected_successes.append(test)
         self._add_detail(test, "XPASS", duration)
         self._record_progress("XPASS")
 
@@ -397,120 +388,133 @@ class JestStyleResult(unittest.TestResult):
             ("Failures", self._failures_detail),
             ("Errors", self._errors_detail),
         ]
-        printed_header = False
+        out: list[str] = []
         for title, entries in sections:
             if not entries:
                 continue
-            if not printed_header:
-                self.stream.writeln("")
-                printed_header = True
-            header = f"{BG_RED}{FG_WHITE}{BOLD} {title.upper()} {RESET}"
-            self.stream.writeln(header)
+            if not out:
+                out.append("\n")
+            out.append(f"{BG_RED}{FG_WHITE}{BOLD} {title.upper()} {RESET}\n")
             for test, err in entries:
                 module_name = test.__class__.__module__
                 file_display, _ = _module_display(module_name)
                 test_title = _explicit_label(test) or "<unnamed>"
-                pointer = color("›", BRIGHT_CYAN)
-                self.stream.writeln(
-                    f"  {color('✕', BRIGHT_RED)} {DIM}{file_display}{RESET} {pointer} "
-                    f"{color(test_title, BRIGHT_RED)}"
+                out.append(
+                    f"  {_ICON_MAP['FAIL']} {DIM}{file_display}{RESET} {_POINTER} "
+                    f"{color(test_title, BRIGHT_RED)}\n"
                 )
-                indented = "\n".join(f"      {line}" for line in err.splitlines())
-                self.stream.writeln(indented)
-                self.stream.writeln("")
+                out.extend(f"      {line}\n" for line in err.splitlines())
+                out.append("\n")
+        if out:
+            self.stream.write("".join(out))
 
-    def _print_group(self, group: ClassGroup, detail_colors: dict[str, str], icon_map: dict[str, str]) -> None:
+    def _render_group(self, group: ClassGroup, out: list[str]) -> None:
         description = group.doc_title or group.name
-        class_line = f"  {color('›', BRIGHT_CYAN)} {description}"
-        self.stream.writeln(class_line)
+        out.append(f"  {_POINTER} {description}\n")
         for detail in group.tests:
-            self._print_detail(detail, detail_colors, icon_map)
+            self._render_detail(detail, out)
 
-    def _print_detail(self, detail: TestDetail, detail_colors: dict[str, str], icon_map: dict[str, str]) -> None:
+    def _render_detail(self, detail: TestDetail, out: list[str]) -> None:
         if not detail.name:
             return
-        icon = icon_map.get(detail.status, color("•", CYAN))
+        icon = _ICON_MAP.get(detail.status, _DEFAULT_ICON)
         duration_ms = f"{detail.duration * 1000:.0f} ms"
-        status_color = detail_colors.get(detail.status, CYAN)
+        status_color = _DETAIL_COLORS.get(detail.status, CYAN)
         text_color = DIM
         if detail.status in {"FAIL", "ERROR"}:
             text_color = status_color
         line = f"    {icon} {color(detail.name, text_color)} {DIM}({duration_ms}){RESET}"
         if detail.note:
             line += f" {DIM}[{detail.note}]{RESET}"
-        self.stream.writeln(line)
+        out.append(line + "\n")
         if detail.summary and detail.summary != detail.name:
-            self.stream.writeln(f"      {DIM}{detail.summary}{RESET}")
+            out.append(f"      {DIM}{detail.summary}{RESET}\n")
         if detail.detail and detail.status in {"FAIL", "ERROR"}:
-            for extra_line in detail.detail.splitlines():
-                self.stream.writeln(f"      {extra_line}")
+            out.extend(f"      {extra_line}\n" for extra_line in detail.detail.splitlines())
 
-    def _print_suite_table(self) -> None:
-        status_colors = _status_colors()
+    def _render_suite_table(self, out: list[str]) -> None:
         header = f"{'Status':<8}{'Pass':>6}{'Fail':>6}{'Skip':>6}{'Time':>10}  Module"
-        self.stream.writeln(header)
-        self.stream.writeln("-" * len(header))
+        out.append(header + "\n")
+        out.append("-" * len(header) + "\n")
         for module_name in self._module_order:
             report = self._module_reports[module_name]
             status = report.headline_status
-            clr = status_colors.get(status, CYAN)
+            clr = _STATUS_COLORS.get(status, CYAN)
             status_text = color(status, clr)
             passed = report.counts.get("PASS", 0)
             failed = report.counts.get("FAIL", 0) + report.counts.get("ERROR", 0)
             skipped = report.counts.get("SKIP", 0)
             duration = _format_duration(report.total_duration)
             module_display = _format_module_display(report.display)
-            self.stream.writeln(f"{status_text:<8}{passed:>6}{failed:>6}{skipped:>6}{duration:>10}  {module_display}")
+            out.append(f"{status_text:<8}{passed:>6}{failed:>6}{skipped:>6}{duration:>10}  {module_display}\n")
 
-    def _print_outliers(self, limit: int = 3) -> None:
+    def _render_outliers(self, out: list[str], limit: int = 3) -> None:
         if not self._all_details:
             return
         sorted_details = sorted(self._all_details, key=lambda d: d.duration)
         fastest = sorted_details[:limit]
         slowest = sorted_details[-limit:][::-1]
-        self.stream.writeln("")
-        self.stream.writeln(color("Fastest tests:", BRIGHT_GREEN))
+        out.append("\n")
+        out.append(color("Fastest tests:", BRIGHT_GREEN) + "\n")
         for detail in fastest:
-            self._print_outlier_line(detail)
-        self.stream.writeln(color("Slowest tests:", BRIGHT_RED))
+            self._render_outlier_line(detail, out)
+        out.append(color("Slowest tests:", BRIGHT_RED) + "\n")
         for detail in slowest:
-            self._print_outlier_line(detail)
+            self._render_outlier_line(detail, out)
 
-    def _print_outlier_line(self, detail: TestDetail) -> None:
+    def _render_outlier_line(self, detail: TestDetail, out: list[str]) -> None:
         duration = _format_duration(detail.duration)
         location = f"{detail.module or ''}.{detail.cls or ''}".strip(".")
         name = f"{location}::{detail.name}" if location else detail.name
         if not name:
             return
-        status_colors = _detail_colors()
-        status_text = color(detail.status, status_colors.get(detail.status, CYAN))
-        self.stream.writeln(f"  {duration:>8} {status_text:<8} {name}")
-
-
-def _status_colors() -> dict[str, str]:
-    return {"PASS": BRIGHT_GREEN, "FAIL": BRIGHT_RED, "SKIP": BRIGHT_YELLOW}
-
-
-def _detail_colors() -> dict[str, str]:
-    return {
-        "PASS": BRIGHT_GREEN,
-        "FAIL": BRIGHT_RED,
-        "ERROR": BRIGHT_RED,
-        "SKIP": BRIGHT_YELLOW,
-        "XF": BRIGHT_YELLOW,
-        "XPASS": BRIGHT_CYAN,
-    }
-
-
-def _icon_map() -> dict[str, str]:
-    return {
-        "PASS": color("✓", BRIGHT_GREEN),
-        "FAIL": color("✕", BRIGHT_RED),
-        "ERROR": color("✕", BRIGHT_RED),
-        "SKIP": color("↷", BRIGHT_YELLOW),
-        "XF": color("≒", BRIGHT_YELLOW),
-        "XPASS": color("★", BRIGHT_CYAN),
-    }
+        status_text = color(detail.status, _DETAIL_COLORS.get(detail.status, CYAN))
+        out.append(f"  {duration:>8} {status_text:<8} {name}\n")
+
+
+# Colors and colored fragments are built once at import; the report paths only look them up.
+_STATUS_COLORS = {"PASS": BRIGHT_GREEN, "FAIL": BRIGHT_RED, "SKIP": BRIGHT_YELLOW}
+_DETAIL_COLORS = {
+    "PASS": BRIGHT_GREEN,
+    "FAIL": BRIGHT_RED,
+    "ERROR": BRIGHT_RED,
+    "SKIP": BRIGHT_YELLOW,
+    "XF": BRIGHT_YELLOW,
+    "XPASS": BRIGHT_CYAN,
+}
+
+_cyan = _colorize(BRIGHT_CYAN)
+_dim = _colorize(DIM)
+
+_ICON_MAP = {
+    "PASS": color("✓", BRIGHT_GREEN),
+    "FAIL": color("✕", BRIGHT_RED),
+    "ERROR": color("✕", BRIGHT_RED),
+    "SKIP": color("↷", BRIGHT_YELLOW),
+    "XF": color("≒", BRIGHT_YELLOW),
+    "XPASS": color("★", BRIGHT_CYAN),
+}
+_DEFAULT_ICON = color("•", CYAN)
+_POINTER = color("›", BRIGHT_CYAN)
+_STATUS_BADGES = {
+    "PASS": f"{BG_GREEN}{FG_WHITE}{BOLD} PASS {RESET}",
+    "FAIL": f"{BG_RED}{FG_WHITE}{BOLD} FAIL {RESET}",
+    "SKIP": color(" SKIP ", BRIGHT_YELLOW),
+}
+
+
+_CLASS_META: WeakKeyDictionary[type, tuple[str, str, str | None]] = WeakKeyDictionary()
+
+
+def _class_meta(cls: type) -> tuple[str, str, str | None]:
+    """Return ``(module, group name, group title)`` for a test class, computed once per class."""
+    try:
+        return _CLASS_META[cls]
+    except KeyError:
+        label = getattr(cls, "__pyjest_describe__", None)
+        meta = (cls.__module__, label or cls.__name__, label or _doc_summary(getattr(cls, "__doc__", None)))
+        _CLASS_META[cls] = meta
+        return meta
 
 
 def _explicit_label(test: unittest.case.TestCase) -> str:
@@ -527,13 +531,9 @@ def _explicit_label(test: unittest.case.TestCase) -> str:
     return ""
 
 
-def _format_badge(status: str, status_colors: dict[str, str]) -> str:
-    clr = status_colors.get(status, CYAN)
-    if status == "PASS":
-        return f"{BG_GREEN}{FG_WHITE}{BOLD} {status} {RESET}"
-    if status == "FAIL":
-        return f"{BG_RED}{FG_WHITE}{BOLD} {status} {RESET}"
-    return color(f" {status} ", clr)
+def _format_badge(status: str) -> str:
+    badge = _STATUS_BADGES.get(status)
+    return badge if badge is not None else color(f" {status} ", CYAN)
 
 
 def _format_module_display(display: str) -> str:
@@ -670,7 +670,7 @@ class JestStyleTestRunner(unittest.TextTestRunner):
         return result
 
     def _print_summary(self, result: JestStyleResult, duration: float) -> None:
-        passed = len(result.successes)
+        passed = result.success_count
         failed = len(result.failures)
         errored = len(result.errors)
         skipped = len(result.skipped)
@@ -688,12 +688,9 @@ class JestStyleTestRunner(unittest.TextTestRunner):
             badge = color(" FAIL ", BRIGHT_RED)
             title = color("Test suites failing", BOLD)
         else:
-            badge = f"{BG_GREEN}{FG_WHITE}{BOLD} PASS {RESET}"
+            badge = _STATUS_BADGES["PASS"]
             title = color("Test suites complete", BOLD)
 
-        self.stream.writeln("")
-        self.stream.writeln(f"{badge} {title}")
-
         def fmt(value: int, label: str, clr: str) -> str | None:
             if value == 0:
                 return None
@@ -717,14 +714,10 @@ class JestStyleTestRunner(unittest.TextTestRunner):
         test_parts.append(f"{total} total")
         test_summary = ", ".join(test_parts)
 
-        self.stream.writeln(f"  Test Suites: {suite_summary}")
-        self.stream.writeln(f"  Tests:       {test_summary}")
-        self.stream.writeln(f"  Time:        {duration:.2f}s")
+        self.stream.write(
+            f"\n{badge} {title}\n"
+            f"  Test Suites: {suite_summary}\n"
+            f"  Tests:       {test_summary}\n"
+            f"  Time:        {duration:.2f}s\n"
+        )
         print_snapshot_summary()
-
-    def _print_group(self, group: ClassGroup, detail_colors: dict[str, str], icon_map: dict[str, str]) -> None:
-        description = group.doc_title or group.name
-        class_line = f"  {color('›', BRIGHT_CYAN)} {description}"
-        self.stream.writeln(class_line)
-        for detail in group.tests:
-            self._print_detail(detail, detail_colors, icon_map)
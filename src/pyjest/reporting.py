@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
@@ -58,7 +57,7 @@ def _build_payload(result: JestStyleResult, coverage_percent: float | None, dura
             "failures": len(result.failures),
             "errors": len(result.errors),
             "skipped": len(result.skipped),
-            "successes": len(getattr(result, "successes", [])),
+            "successes": getattr(result, "success_count", 0),
             "duration": duration,
             "coverage": coverage_percent,
         },
@@ -82,6 +81,8 @@ def _write_tap_report(base_dir: Path, payload: dict[str, Any], suffix: str | Non
 
 
 def _write_junit_report(base_dir: Path, payload: dict[str, Any], suffix: str | None) -> None:
+    import xml.etree.ElementTree as ET
+
     testsuites = ET.Element("testsuites")
     for suite in payload["suites"]:
         ts = ET.SubElement(
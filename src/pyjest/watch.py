@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import queue
 import time
-import threading
+from collections import deque
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Sequence
 
-from .discovery import _module_name_from_path
+from .discovery import _PYJEST_SUFFIX_TUPLE, _module_name_from_path
 
 try:  # Optional fast backends
     from watchfiles import watch as watchfiles_watch  # type: ignore
@@ -25,33 +27,78 @@ except Exception:
     HAS_WATCHDOG = False
 
 
-def snapshot_watchable_files(root: Path) -> dict[Path, float]:
-    """Return map of watchable files to mtimes."""
-    snapshot: dict[Path, float] = {}
-    for path in _iter_watchable(root):
-        mtime = _safe_mtime(path)
-        if mtime is not None:
-            snapshot[path] = mtime
+Snapshot = dict[str, tuple[int, int]]
+_WATCH_SUFFIXES = (".py", ".pyj", ".pyjest")
+
+
+def snapshot_watchable_files(root: Path) -> Snapshot:
+    """Return map of watchable file paths (as strings) to ``(mtime_ns, size)``."""
+    snapshot: Snapshot = {}
+    _refresh_snapshot(snapshot, root)
     return snapshot
 
 
-def detect_changes(previous: dict[Path, float], root: Path) -> tuple[set[Path], dict[Path, float]]:
-    current = snapshot_watchable_files(root)
-    changed = _diff_snapshots(previous, current)
-    return changed, current
+def detect_changes(previous: Snapshot, root: Path) -> tuple[set[Path], Snapshot]:
+    changed = _refresh_snapshot(previous, root)
+    return changed, previous
+
+
+def _refresh_snapshot(snapshot: Snapshot, root: Path) -> set[Path]:
+    """Rescan ``root`` and update ``snapshot`` in place, returning the added, modified and removed paths."""
+    current: Snapshot = {}
+    pending = deque([str(root)])
+    while pending:
+        try:
+            it = os.scandir(pending.popleft())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                if not entry.name.endswith(_WATCH_SUFFIXES):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                current[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    # A quiet tick is one C-level dict comparison; per-path diffing and Path objects only follow a real change.
+    if current == snapshot:
+        return set()
+    changed = {Path(path) for path, key in current.items() if snapshot.get(path) != key}
+    changed.update(Path(path) for path in snapshot.keys() - current.keys())
+    snapshot.clear()
+    snapshot.update(current)
+    return changed
 
 
 def has_fast_watcher() -> bool:
     return HAS_WATCHFILES or HAS_WATCHDOG
 
 
-def next_change(snapshot: dict[Path, float], root: Path, interval: float) -> tuple[set[Path], dict[Path, float]]:
+def has_native_debounce() -> bool:
+    """True when the backend batches bursts of events itself, so callers can skip their own debounce pass."""
+    return has_fast_watcher()
+
+
+def next_change(
+    snapshot: Snapshot, root: Path, interval: float, debounce: float = 0.0
+) -> tuple[set[Path], Snapshot]:
+    # Event backends already name the dirty paths; stat just those instead of walking the tree again.
+    # Batches that net out to nothing (a touch, a file created and removed) keep the wait going.
+    changed: set[Path] = set()
     if HAS_WATCHFILES:
-        changed = _watchfiles_wait(root)
-        return changed, snapshot_watchable_files(root)
+        while not changed:
+            changed = _apply_events(snapshot, root, _watchfiles_wait(root, debounce))
+        return changed, snapshot
     if HAS_WATCHDOG:
-        changed = _watchdog_wait(root, interval)
-        return changed, snapshot_watchable_files(root)
+        while not changed:
+            changed = _apply_events(snapshot, root, _watchdog_wait(root, interval, debounce))
+        return changed, snapshot
     return detect_changes(snapshot, root)
 
 
@@ -61,54 +108,59 @@ def targets_from_changed(changed: set[Path], default_targets: Sequence[str]) ->
         return list(default_targets)
     targets: list[str] = []
     for path in sorted(changed):
-        if path.suffix in {".pyjest", ".pyj"}:
+        name = path.name
+        if name.endswith(_PYJEST_SUFFIX_TUPLE):
             targets.append(str(path))
-        elif path.suffix == ".py":
+        elif name.endswith(".py"):
             targets.append(_module_name_from_path(path))
     return targets or list(default_targets)
 
 
-def wait_for_change(snapshot: dict[Path, float], root: Path, interval: float) -> tuple[set[Path], dict[Path, float]]:
+def wait_for_change(snapshot: Snapshot, root: Path, interval: float) -> tuple[set[Path], Snapshot]:
     while True:
-        changed, snapshot = detect_changes(snapshot, root)
+        changed = _refresh_snapshot(snapshot, root)
         if changed:
             return changed, snapshot
         time.sleep(interval)
 
 
-def _iter_watchable(root: Path) -> Iterable[Path]:
-    patterns = (".py", ".pyj", ".pyjest")
-    for path in root.rglob("*"):
-        if path.is_dir() or _is_hidden(path):
-            continue
-        if path.suffix in patterns:
-            yield path
-
-
-def _is_hidden(path: Path) -> bool:
-    return any(part.startswith(".") for part in path.parts)
-
-
-def _safe_mtime(path: Path) -> float | None:
-    try:
-        return path.stat().st_mtime
-    except OSError:
-        return None
+def _is_watchable(path: str, root_str: str) -> bool:
+    # Same scope as the polling snapshot: watched suffixes, nothing under dot-directories.
+    if not path.endswith(_WATCH_SUFFIXES):
+        return False
+    return not any(part.startswith(".") for part in os.path.relpath(path, root_str).split(os.sep))
 
 
-def _diff_snapshots(previous: dict[Path, float], current: dict[Path, float]) -> set[Path]:
+def _apply_events(snapshot: Snapshot, root: Path, paths: set[Path]) -> set[Path]:
+    """Update ``snapshot`` for the paths a backend reported, returning the watchable ones whose stat changed."""
+    root_str = str(root)
     changed: set[Path] = set()
-    for path, mtime in current.items():
-        if previous.get(path) != mtime:
-            changed.add(path)
-    for path in previous:
-        if path not in current:
+    for path in paths:
+        key = str(path)
+        if not _is_watchable(key, root_str):
+            continue
+        try:
+            stat = os.stat(key)
+        except OSError:
+            if snapshot.pop(key, None) is not None:
+                changed.add(path)
+            continue
+        entry = (stat.st_mtime_ns, stat.st_size)
+        if snapshot.get(key) != entry:
+            snapshot[key] = entry
             changed.add(path)
     return changed
 
 
-def _watchfiles_wait(root: Path) -> set[Path]:
-    for changes in watchfiles_watch(str(root), recursive=True):
+def _watchfiles_wait(root: Path, debounce: float = 0.0) -> set[Path]:
+    root_str = str(root)
+
+    def watchable(_change, path: str) -> bool:
+        return _is_watchable(path, root_str)
+
+    for changes in watchfiles_watch(
+        root_str, recursive=True, watch_filter=watchable, debounce=int(debounce * 1000)
+    ):
         if not changes:
             continue
         paths = {Path(change[1]) for change in changes}
@@ -116,24 +168,32 @@ def _watchfiles_wait(root: Path) -> set[Path]:
     return set()
 
 
-def _watchdog_wait(root: Path, timeout: float) -> set[Path]:
-    fired = threading.Event()
-    changed: set[Path] = set()
+def _watchdog_wait(root: Path, timeout: float, debounce: float = 0.0) -> set[Path]:
+    events: queue.Queue[Path] = queue.Queue()
 
     class Handler(FileSystemEventHandler):  # type: ignore[misc]
         def on_any_event(self, event):  # type: ignore[override]
             if event.is_directory:
                 return
-            changed.add(Path(event.src_path))
-            fired.set()
+            events.put(Path(event.src_path))
 
     observer = Observer()
     handler = Handler()
     observer.schedule(handler, str(root), recursive=True)
     observer.start()
     try:
-        fired.wait(timeout=timeout or 1.0)
+        return _drain_events(events, timeout or 1.0, debounce)
     finally:
         observer.stop()
         observer.join()
-    return changed
+
+
+def _drain_events(events: queue.Queue[Path], timeout: float, debounce: float) -> set[Path]:
+    """Wait up to ``timeout`` for a first event, then coalesce until ``debounce`` seconds pass without one."""
+    changed: set[Path] = set()
+    try:
+        changed.add(events.get(timeout=timeout))
+        while True:
+            changed.add(events.get(timeout=debounce) if debounce else events.get_nowait())
+    except queue.Empty:
+        return changed
@@ -1,7 +1,9 @@
 import asyncio
 import unittest
+import unittest.mock
 
 from pyjest import describe, test
+from pyjest import assert_equal, assert_is, assert_none, assert_truthy
 from pyjest.assertions import expect, expect_async
 
 
@@ -13,6 +15,31 @@ class ExpectationTests(unittest.TestCase):
             expect({"a": 1, "b": 2}).to_equal({"a": 1, "b": 3})
         self.assertIn("Diff:", str(ctx.exception))
 
+    @test("equality failure message is built only when rendered")
+    def test_to_equal_formats_lazily(self) -> None:
+        with unittest.mock.patch("pyjest.assertions._diff_lines", return_value="<diff>") as diff:
+            with self.assertRaises(AssertionError) as ctx:
+                expect([1]).to_equal([2])
+            diff.assert_not_called()
+            message = str(ctx.exception)
+            self.assertEqual(str(ctx.exception), message)
+        diff.assert_called_once_with(["[2]"], ["[1]"])
+        self.assertIn("Expected: [2]", message)
+
+    @test("free-function matchers mirror the expect forms")
+    def test_free_function_matchers(self) -> None:
+        obj = object()
+        assert_equal({"a": 1}, {"a": 1})
+        assert_is(obj, obj)
+        assert_truthy([0])
+        assert_none(None)
+        with self.assertRaises(AssertionError) as ctx:
+            assert_equal([1], [2])
+        self.assertIn("Diff:", str(ctx.exception))
+        for check in (lambda: assert_is(obj, object()), lambda: assert_truthy(""), lambda: assert_none(0)):
+            with self.assertRaises(AssertionError):
+                check()
+
     @test("checks identity correctly")
     def test_to_be_identity(self) -> None:
         obj = object()
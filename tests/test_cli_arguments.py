@@ -73,6 +73,11 @@ class CliArgumentParsingTests(unittest.TestCase):
         self.assertAlmostEqual(args.watch_interval, 2.5)
         self.assertAlmostEqual(args.watch_debounce, 0.7)
 
+    @test("force poll defaults off and can be enabled")
+    def test_force_poll_flag(self) -> None:
+        self.assertFalse(_parse("tests").force_poll)
+        self.assertTrue(_parse("--force-poll").force_poll)
+
     @test("sets run failures first")
     def test_run_failures_first_flag_sets_true(self) -> None:
         args = _parse("--run-failures-first")
@@ -216,6 +221,14 @@ class CliArgumentParsingTests(unittest.TestCase):
         args = _parse("--maxWorkers", "3")
         self.assertEqual(args.maxWorkers, 3)
 
+    @test("parses affinity cpu lists and group sizes")
+    def test_affinity_parsing(self) -> None:
+        self.assertIsNone(_parse("tests").affinity)
+        self.assertEqual(_parse("--affinity", "0-2,5").affinity, [(0,), (1,), (2,), (5,)])
+        self.assertEqual(_parse("--affinity", "[0-3]:2").affinity, [(0, 1), (2, 3)])
+        with self.assertRaises(SystemExit):
+            _parse("--affinity", "a-b")
+
     # Snapshots -----------------------------------------------------------
 
     @test("sets updateSnapshot flag")
@@ -230,6 +243,15 @@ class CliArgumentParsingTests(unittest.TestCase):
 
     # Coverage ------------------------------------------------------------
 
+    @test("parses per-module coverage thresholds")
+    def test_module_thresholds_parse(self) -> None:
+        args = _parse("--coverage-threshold-module", "pkg.*=80", "--coverage-threshold-module", "core=12.5")
+        self.assertEqual(args.coverage_threshold_module, {"pkg.*": 80.0, "core": 12.5})
+        with self.assertRaises(SystemExit):
+            _parse("--coverage-threshold-module", "pkg")
+        with self.assertRaises(SystemExit):
+            _parse("--coverage-threshold-module", "pkg=high")
+
     @test("coverage html implies coverage on")
     def test_coverage_html_implies_coverage(self) -> None:
         args = _parse("--coverage-html")
@@ -328,6 +350,20 @@ class CliArgumentParsingTests(unittest.TestCase):
         args = _parse("--no-color-diffs")
         self.assertFalse(args.color_diffs)
 
+    @test("parser is reused without sharing list defaults between parses")
+    def test_parser_reused_without_shared_defaults(self) -> None:
+        first = _parse("--report-format", "json")
+        second = _parse("tests")
+
+        self.assertEqual(first.report_format, ["json", "console"])
+        self.assertEqual(second.report_format, ["console"])
+        self.assertIsNot(second.report_format, _parse("tests").report_format)
+
+    @test("full repr flag parsed")
+    def test_full_repr_flag(self) -> None:
+        self.assertFalse(_parse("tests").full_repr)
+        self.assertTrue(_parse("--full-repr").full_repr)
+
     @test("max diff lines value parsed")
     def test_max_diff_lines_value(self) -> None:
         args = _parse("--max-diff-lines", "42")
@@ -338,6 +374,11 @@ class CliArgumentParsingTests(unittest.TestCase):
         args = _parse("--max-diff-lines", "0")
         self.assertEqual(args.max_diff_lines, 0)
 
+    @test("max diff cells value parsed")
+    def test_max_diff_cells_value(self) -> None:
+        self.assertEqual(_parse("tests").max_diff_cells, 5_000_000)
+        self.assertEqual(_parse("--mdc", "0").max_diff_cells, 0)
+
     @test("buffer flag sets true")
     def test_buffer_flag_sets_true(self) -> None:
         args = _parse("--buffer")
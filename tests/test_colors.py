@@ -0,0 +1,17 @@
+import unittest
+
+from pyjest import describe, test
+from pyjest.colors import BRIGHT_CYAN, RESET, _colorize, color
+
+
+@describe("Color helpers")
+class ColorHelperTests(unittest.TestCase):
+    @test("color wraps text in the code and reset")
+    def test_color_wraps_text(self) -> None:
+        self.assertEqual(color("hi", BRIGHT_CYAN), f"{BRIGHT_CYAN}hi{RESET}")
+
+    @test("colorize caches one painter per code")
+    def test_colorize_is_cached(self) -> None:
+        paint = _colorize(BRIGHT_CYAN)
+        self.assertIs(paint, _colorize(BRIGHT_CYAN))
+        self.assertEqual(paint("hi"), color("hi", BRIGHT_CYAN))
@@ -2,11 +2,19 @@ import builtins
 import os
 import sys
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
 from pyjest import describe, test
 from pyjest.colors import BRIGHT_GREEN, BRIGHT_RED, BRIGHT_YELLOW
 from pyjest import coverage_support
+from pyjest.orchestrator.runner import (
+    _coverage_module_name,
+    _quiet_coverage,
+    _module_thresholds_failed,
+    module_threshold_misses,
+)
 
 
 @describe("Coverage helper utilities")
@@ -35,6 +43,49 @@ class CoverageSupportTests(unittest.TestCase):
         self.assertIn(BRIGHT_RED, bar_red)
         self.assertIn("░░░░░░░░", bar_red)
 
+    @test("text report streams straight to stdout")
+    def test_write_text_report_streams_to_stdout(self) -> None:
+        cov = mock.MagicMock()
+        cov.report.return_value = 87.5
+        with mock.patch("sys.stdout") as fake_stdout:
+            percent = coverage_support._write_text_report(cov)
+
+        self.assertEqual(percent, 87.5)
+        cov.report.assert_called_once_with(skip_empty=True, file=fake_stdout)
+
+    @test("quiet text report keeps the total but not the table")
+    def test_write_text_report_quiet(self) -> None:
+        cov = mock.MagicMock()
+        cov.report.return_value = 42.0
+        with mock.patch("sys.stdout") as fake_stdout:
+            percent = coverage_support._write_text_report(cov, quiet=True)
+
+        self.assertEqual(percent, 42.0)
+        self.assertIsNot(cov.report.call_args.kwargs["file"], fake_stdout)
+        fake_stdout.write.assert_not_called()
+
+    @test("per-file stats are only collected when something reads them")
+    def test_report_coverage_skips_unused_stats(self) -> None:
+        cov = mock.MagicMock()
+        cov.report.return_value = 50.0
+        cov.get_data.return_value.measured_files.return_value = ["a.py"]
+        cov.analysis2.return_value = ("a.py", [1, 2], [2], [], "")
+        with mock.patch("sys.stdout"):
+            self.assertEqual(coverage_support.report_coverage(cov, None), (50.0, []))
+            cov.analysis2.assert_not_called()
+            _, stats = coverage_support.report_coverage(cov, None, keep_stats=True)
+
+        self.assertEqual(stats, [coverage_support.FileStat("a.py", 50.0)])
+
+    @test("file highlights list the three best then the three worst files")
+    def test_print_file_highlights_order(self) -> None:
+        stats = [coverage_support.FileStat(f"f{i}.py", float(p)) for i, p in enumerate([40, 90, 10, 70, 100, 55, 20])]
+        with mock.patch("builtins.print") as fake_print:
+            coverage_support._print_file_highlights(stats)
+
+        names = [call.args[0].split()[-1] for call in fake_print.call_args_list[1:]]
+        self.assertEqual(names, ["f4.py", "f1.py", "f3.py", "f0.py", "f6.py", "f2.py"])
+
     @test("retry without C extension falls back cleanly")
     def test_retry_without_c_extension_uses_pure_python(self) -> None:
         sentinel = object()
@@ -71,6 +122,39 @@ class CoverageSupportTests(unittest.TestCase):
         else:
             os.environ["COVERAGE_CORE"] = core_env
 
+    @test("per-module thresholds match module globs against root-relative names")
+    def test_module_threshold_misses(self) -> None:
+        root = Path(os.getcwd()).resolve()
+        stats = [
+            coverage_support.FileStat(str(root / "pkg" / "core.py"), 40.0),
+            coverage_support.FileStat(str(root / "pkg" / "util.py"), 95.0),
+            coverage_support.FileStat(str(root / "other.py"), 10.0),
+        ]
+
+        misses = module_threshold_misses(stats, {"pkg.*": 80.0}, root)
+
+        self.assertEqual(misses, [("pkg.core", 40.0, 80.0)])
+        self.assertEqual(module_threshold_misses(stats, {}, root), [])
+        self.assertTrue(_module_thresholds_failed(stats, {"pkg.*": 80.0}, root))
+        self.assertFalse(_module_thresholds_failed(stats, {"pkg.util": 80.0}, root))
+
+    @test("watch-quiet hides the coverage table only in watch mode")
+    def test_quiet_coverage_needs_watch(self) -> None:
+        self.assertTrue(_quiet_coverage(SimpleNamespace(watch=True, watch_quiet=True)))
+        self.assertFalse(_quiet_coverage(SimpleNamespace(watch=False, watch_quiet=True)))
+        self.assertFalse(_quiet_coverage(SimpleNamespace(watch_quiet=True)))
+
+    @test("module names are memoized per file and root")
+    def test_coverage_module_name_cached(self) -> None:
+        _coverage_module_name.cache_clear()
+        prefix = os.path.join(os.sep + "proj", "")
+        filename = os.path.join(prefix, "pkg", "core.py")
+
+        self.assertEqual(_coverage_module_name(filename, prefix), "pkg.core")
+        self.assertEqual(_coverage_module_name(filename, prefix), "pkg.core")
+        self.assertEqual(_coverage_module_name.cache_info().hits, 1)
+        self.assertEqual(_coverage_module_name(filename, os.path.join(prefix, "pkg", "")), "core")
+
 
 if __name__ == "__main__":
     unittest.main()
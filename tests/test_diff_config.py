@@ -1,7 +1,8 @@
 import unittest
+from unittest import mock
 
-from pyjest import describe, test
-from pyjest.assertions import DIFF_CONFIG, configure_diffs, expect
+from pyjest import assertions, describe, test
+from pyjest.assertions import DIFF_CONFIG, _diff, configure_diffs, expect
 
 
 @describe("Diff configuration")
@@ -10,6 +11,72 @@ class DiffConfigTests(unittest.TestCase):
         # Reset diff settings after each test to avoid bleeding into others.
         configure_diffs(200, True)
 
+    @test("failure values use a bounded repr unless full repr is requested")
+    def test_bounded_repr_and_full_repr(self) -> None:
+        big = list(range(500))
+        with self.assertRaises(AssertionError) as ctx:
+            expect(big).to_equal([-1] + big)
+        headers = str(ctx.exception).split("\nDiff:\n")[0]
+        self.assertIn("...", headers.splitlines()[1])
+        self.assertNotIn("499", headers)
+
+        configure_diffs(200, True, full_repr=True)
+        with self.assertRaises(AssertionError) as ctx:
+            expect(big).to_equal([-1] + big)
+        self.assertIn("499", str(ctx.exception))
+
+    @test("failure messages pprint each value once")
+    def test_failure_pprints_each_value_once(self) -> None:
+        for full_repr in (True, False):
+            configure_diffs(200, False, full_repr=full_repr)
+            with mock.patch.object(assertions, "_full_pretty", wraps=assertions._full_pretty) as pretty:
+                with self.assertRaises(AssertionError) as ctx:
+                    expect({"a": list(range(100))}).to_equal({"a": list(range(99)) + [-1]})
+                message = str(ctx.exception)
+            self.assertEqual(pretty.call_count, 2)
+            self.assertIn("-1", message)
+
+    @test("bounded reprs fall back to full output when they hide the difference")
+    def test_bounded_repr_falls_back_when_equal(self) -> None:
+        configure_diffs(200, False)
+        left = list(range(100))
+        right = left[:-1] + [-1]
+
+        diff = _diff(left, right)
+
+        self.assertIn("-1", diff)
+        self.assertNotIn("__eq__ disagrees", diff)
+
+    @test("huge unlimited diffs are clipped to the cell budget")
+    def test_max_diff_cells_clips_inputs(self) -> None:
+        configure_diffs(0, False, max_diff_cells=100)
+        expected = "\n".join(f"line {i}" for i in range(50))
+        actual = expected.replace("line 5", "line five").replace("line 49", "line forty-nine")
+
+        diff = _diff(expected, actual)
+
+        self.assertIn("+line five", diff)
+        self.assertIn("diff limited to the first 10 lines", diff)
+        self.assertNotIn("line 49", diff)
+
+        configure_diffs(0, False, max_diff_cells=0)
+        self.assertIsNone(DIFF_CONFIG.max_diff_cells)
+        self.assertIn("+line forty-nine", _diff(expected, actual))
+
+    @test("differences past the diff limit are located instead of hidden")
+    def test_diff_difference_past_limit(self) -> None:
+        configure_diffs(200, False)
+        expected = "\n".join(f"line {i}" for i in range(300))
+        actual = expected.replace("line 249", "line changed")
+
+        diff = _diff(expected, actual)
+
+        self.assertEqual(
+            diff.splitlines(),
+            ["... (first 200 lines match; values first differ at line 250)", "-line 249", "+line changed"],
+        )
+        self.assertIn("values first differ at line 301", _diff(expected, expected + "\nextra"))
+
     @test("max diff lines of zero disables truncation")
     def test_configure_diffs_zero_unlimited(self) -> None:
         configure_diffs(0, True)
@@ -27,5 +94,73 @@ class DiffConfigTests(unittest.TestCase):
         self.assertNotIn("\033", message)  # no ANSI color codes when disabled
 
 
+    @test("diffs render unified hunks and skip distant unchanged lines")
+    def test_diff_is_unified(self) -> None:
+        configure_diffs(200, False)
+        expected = "\n".join(f"line {i}" for i in range(20))
+        actual = expected.replace("line 10", "line ten")
+
+        diff = _diff(expected, actual)
+
+        self.assertTrue(diff.startswith("@@ "))
+        self.assertIn("-line 10\n+line ten", diff)
+        self.assertNotIn("line 1\n", diff)
+
+
+    @test("truncated diffs report how many lines were dropped")
+    def test_diff_truncation_count(self) -> None:
+        configure_diffs(3, False)
+        expected = "\n".join("abcdef")
+        actual = "\n".join("ABCDEF")
+
+        lines = _diff(expected, actual).splitlines()
+
+        # Inputs clip to 3 lines each: "@@" + 3 removals + 3 additions = 7 lines, 2 shown plus the marker.
+        self.assertEqual(lines, ["@@ -1,3 +1,3 @@", "-a", "... (5 more lines truncated)"])
+
+    @test("diff explains values that print the same but compare unequal")
+    def test_diff_identical_repr(self) -> None:
+        class Stubborn:
+            def __eq__(self, other: object) -> bool:
+                return False
+
+            def __repr__(self) -> str:
+                return "Stubborn()"
+
+        self.assertEqual(_diff(Stubborn(), Stubborn()), "(values repr equal; __eq__ disagrees)")
+
+    @test("strings differing only in line endings show the endings")
+    def test_diff_line_endings(self) -> None:
+        configure_diffs(200, False)
+
+        self.assertIn("-'a\\n'\n+'a'", _diff("a\n", "a"))
+        self.assertIn("-'x\\r\\n'\n+'x\\n'", _diff("x\r\n", "x\n"))
+        self.assertNotIn("__eq__ disagrees", _diff("a\n", "a"))
+
+    @test("structured failures diff line by line at the differing key")
+    def test_structured_diff_is_multiline(self) -> None:
+        configure_diffs(200, False)
+        records = {f"key{i}": {"id": i, "name": f"record {i}"} for i in range(10)}
+        changed = {**records, "key5": {"id": 5, "name": "renamed"}}
+
+        diff = _diff(records, changed)
+
+        self.assertIn("- 'key5': {'id': 5, 'name': 'record 5'},", diff)
+        self.assertIn("+ 'key5': {'id': 5, 'name': 'renamed'},", diff)
+        self.assertNotIn("key0", diff)
+
+
+    @test("string failures show quoted one-line headers without pprint")
+    def test_string_failure_headers(self) -> None:
+        configure_diffs(200, False)
+        expected = "x" * 300 + "\nend"
+        with self.assertRaises(AssertionError) as ctx:
+            expect(expected + "!").to_equal(expected)
+
+        header = str(ctx.exception).splitlines()[1]
+        self.assertTrue(header.startswith("Expected: 'xxx"))
+        self.assertIn("...", header)
+        self.assertIn("+end!", str(ctx.exception))
+
 if __name__ == "__main__":
     unittest.main()
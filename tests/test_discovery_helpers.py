@@ -0,0 +1,308 @@
+import fnmatch
+import os
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+import unittest.mock
+
+from pyjest import describe, test
+from pyjest.discovery import (
+    _PyjestSourceLoader,
+    _auto_patterns,
+    _compile_excludes,
+    _enumerate_test_modules,
+    _filter_suite,
+    _first_pattern_index,
+    _forget_layout,
+    _flatten_suite,
+    _has_test_files,
+    _load_targets,
+    _merge_suites,
+    _module_file,
+    _pyjest_module,
+    _scan_pyjest,
+    _should_exclude,
+    mark_pyjest,
+    marked_modules,
+)
+
+
+@describe("Discovery helper utilities")
+class DiscoveryHelperTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.root = Path(self._tmpdir.name)
+        self.addCleanup(_forget_layout)
+
+    @test("scan_pyjest finds pyjest files and skips cache and vcs dirs")
+    def test_scan_pyjest_sorted_and_pruned(self) -> None:
+        for rel in ("b/two.pyjest", "a/one.pyj", "top.pyjest", ".git/hidden.pyjest", "__pycache__/x.pyjest"):
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        (self.root / "a" / "plain.py").write_text("")
+
+        found = sorted(_scan_pyjest(self.root))
+
+        self.assertEqual(
+            found,
+            [self.root / "a" / "one.pyj", self.root / "b" / "two.pyjest", self.root / "top.pyjest"],
+        )
+
+    @test("has_test_files ignores other suffixes and files hidden in skipped dirs")
+    def test_has_test_files(self) -> None:
+        (self.root / "node_modules").mkdir()
+        (self.root / "node_modules" / "dep.py").write_text("")
+        (self.root / "notes.txt").write_text("")
+        self.assertFalse(_has_test_files(self.root))
+        (self.root / "test_real.py").write_text("")
+        self.assertTrue(_has_test_files(self.root))
+
+    @test("auto patterns add pytest and Django layouts found outside skipped dirs")
+    def test_auto_patterns_probe(self) -> None:
+        (self.root / ".venv").mkdir()
+        (self.root / ".venv" / "vendored_test.py").write_text("")
+        self.assertEqual(_auto_patterns("test*.py", self.root), ["test*.py"])
+
+        (self.root / "app").mkdir()
+        (self.root / "app" / "tests.py").write_text("")
+        (self.root / "app" / "models_test.py").write_text("")
+        # The probe is cached until the layout is forgotten, as watch mode does when files are added.
+        self.assertEqual(_auto_patterns("test*.py", self.root), ["test*.py"])
+        _forget_layout()
+        self.assertEqual(_auto_patterns("test*.py", self.root), ["test*.py", "*_test.py", "tests.py"])
+        self.assertEqual(_auto_patterns("spec_*.py", self.root), ["spec_*.py"])
+
+    @test("pattern matching agrees with fnmatch and reports the first matching glob")
+    def test_first_pattern_index(self) -> None:
+        names = ("test_a.py", "tests.py", "test.py", "my_test.py", "atest.py", "Test_x.py", "test_a.PY", "a_b_c.py")
+        for name in names:
+            expected = 0 if fnmatch.fnmatch(name, "test*.py") else None
+            self.assertEqual(_first_pattern_index(name, ("test*.py",)), expected, name)
+
+        patterns = ("test*.py", "*_test.py", "tests.py", "a*b*c*.py")
+        self.assertEqual(_first_pattern_index("test_x_test.py", patterns), 0)
+        self.assertEqual(_first_pattern_index("x_test.py", patterns), 1)
+        self.assertEqual(_first_pattern_index("a_b_c.py", patterns), 3)
+        self.assertIsNone(_first_pattern_index("conftest.py", patterns))
+
+    @test("has_test_files remembers hits but rechecks misses")
+    def test_has_test_files_caches_hits(self) -> None:
+        self.assertFalse(_has_test_files(self.root))
+        (self.root / "test_late.py").write_text("")
+        self.assertTrue(_has_test_files(self.root))
+        with unittest.mock.patch("pyjest.discovery._scan_files") as scan:
+            self.assertTrue(_has_test_files(self.root))
+        scan.assert_not_called()
+
+    @test("should_exclude matches root-relative patterns and ignored dirs by prefix")
+    def test_should_exclude(self) -> None:
+        root = str(self.root)
+        path = str(self.root / "build" / "test_gen.py")
+
+        none = _compile_excludes(())
+
+        self.assertTrue(_should_exclude(path, _compile_excludes(("build/*",)), (), root))
+        self.assertTrue(_should_exclude(path, _compile_excludes(("dist/*", "gen.py")), (), root))
+        self.assertTrue(_should_exclude(path, none, (str(self.root / "build"),), root))
+        self.assertFalse(_should_exclude(path, none, (str(self.root / "bui"),), root))
+        self.assertFalse(_should_exclude(path, _compile_excludes(("dist/*", "test_*.txt")), (), root))
+
+    @test("enumerate_test_modules walks subpackages concurrently in the same order")
+    def test_enumerate_modules_parallel_matches_serial(self) -> None:
+        for rel in ("pkg_b/__init__.py", "pkg_b/test_two.py", "pkg_a/__init__.py", "pkg_a/test_one.py",
+                    "loose/test_skipped.py", "test_top.py", "spec.pyjest"):
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+
+        serial = _enumerate_test_modules(self.root, ["test*.py"])
+        parallel = _enumerate_test_modules(self.root, ["test*.py"], workers=3)
+
+        self.assertEqual(serial, ["pkg_a.test_one", "pkg_b.test_two", "test_top"])
+        self.assertEqual(parallel, serial)
+
+    @test("pyjest bytecode is cached under its own name and reused")
+    def test_pyjest_bytecode_cache(self) -> None:
+        source = self.root / "spec_cached.pyjest"
+        source.write_text("VALUE = 41 + 1\n")
+        loader = _PyjestSourceLoader("spec_cached", str(source))
+
+        with unittest.mock.patch.object(sys, "dont_write_bytecode", False):
+            first = loader.get_code("spec_cached")
+        cache = self.root / "__pycache__" / f"spec_cached.pyjest.{sys.implementation.cache_tag}.pyc"
+        self.assertTrue(cache.is_file())
+
+        with unittest.mock.patch.object(_PyjestSourceLoader, "source_to_code") as compile_source:
+            second = loader.get_code("spec_cached")
+        compile_source.assert_not_called()
+        self.assertEqual(first.co_consts, second.co_consts)
+
+        source.write_text("VALUE = 7\n")
+        namespace: dict = {}
+        exec(loader.get_code("spec_cached"), namespace)
+        self.assertEqual(namespace["VALUE"], 7)
+
+    @test("mark_pyjest records the calling module by default")
+    def test_mark_pyjest_uses_caller_module(self) -> None:
+        mark_pyjest()
+        self.assertIn(__name__, marked_modules())
+
+    @test("directory targets load packages and pyjest files but skip loose subdirectories")
+    def test_load_directory_target_matches_discover(self) -> None:
+        body = "import unittest\nclass Case(unittest.TestCase):\n    def test_ok(self): pass\n"
+        for rel in ("pkg_fused/__init__.py", "pkg_fused/test_fused_inner.py", "loose/test_fused_loose.py",
+                    "test_fused_top.py", "test_fused_spec.pyj"):
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("" if rel.endswith("__init__.py") else body)
+        self.addCleanup(sys.path.remove, str(self.root.resolve()))
+        for name in ("pkg_fused", "pkg_fused.test_fused_inner", "test_fused_top", "test_fused_spec"):
+            self.addCleanup(sys.modules.pop, name, None)
+
+        suite = _load_targets(unittest.TestLoader(), [str(self.root)], "test*.py")
+
+        self.assertEqual(
+            [t.id() for t in suite],
+            ["pkg_fused.test_fused_inner.Case.test_ok", "test_fused_top.Case.test_ok", "test_fused_spec.Case.test_ok"],
+        )
+
+    @test("same-named modules in two directory targets fail instead of shadowing")
+    def test_load_directory_targets_reject_shadowed_module(self) -> None:
+        for rel, body in (("a/test_shadowed.py", "pass"), ("b/test_shadowed.py", "self.fail('b')")):
+            path = self.root / rel
+            path.parent.mkdir(parents=True)
+            path.write_text(f"import unittest\nclass Case(unittest.TestCase):\n    def test_it(self): {body}\n")
+            self.addCleanup(sys.path.remove, str(path.parent.resolve()))
+        self.addCleanup(sys.modules.pop, "test_shadowed", None)
+        loader = unittest.TestLoader()
+
+        suite = _load_targets(loader, [str(self.root / "a"), str(self.root / "b")], "test*.py")
+
+        self.assertEqual(
+            [t.id() for t in suite], ["test_shadowed.Case.test_it", "unittest.loader._FailedTest.test_shadowed"]
+        )
+        self.assertIn("incorrectly imported", loader.errors[0])
+        self.assertIn(repr(str((self.root / "b").resolve())), loader.errors[0])
+
+    @test("a module that fails to import is reported without stopping its directory")
+    def test_load_directory_target_reports_broken_module(self) -> None:
+        good = "import unittest\nclass Case(unittest.TestCase):\n    def test_ok(self): pass\n"
+        (self.root / "test_broken_raises.py").write_text("raise RuntimeError('boom at import')\n")
+        (self.root / "test_broken_syntax.py").write_text("def nope(:\n")
+        (self.root / "test_broken_zgood.py").write_text(good)
+        self.addCleanup(sys.path.remove, str(self.root.resolve()))
+        for name in ("test_broken_raises", "test_broken_syntax", "test_broken_zgood"):
+            self.addCleanup(sys.modules.pop, name, None)
+        loader = unittest.TestLoader()
+
+        suite = _load_targets(loader, [str(self.root)], "test*.py")
+
+        self.assertEqual(
+            [t.id() for t in suite],
+            [
+                "unittest.loader._FailedTest.test_broken_raises",
+                "unittest.loader._FailedTest.test_broken_syntax",
+                "test_broken_zgood.Case.test_ok",
+            ],
+        )
+        self.assertIn("boom at import", loader.errors[0])
+        self.assertIn("SyntaxError", loader.errors[1])
+
+    @test("module and test-id targets skip the layout probe")
+    def test_load_targets_probes_only_for_directories(self) -> None:
+        with unittest.mock.patch("pyjest.discovery._probe_test_layouts") as probe:
+            suite = _load_targets(unittest.TestLoader(), [self.id()], "test*.py")
+        probe.assert_not_called()
+        self.assertEqual([t.id() for t in suite], [self.id()])
+
+    @test("pyjest modules are reused until the file changes")
+    def test_pyjest_module_cache(self) -> None:
+        spec = self.root / "cached_spec.pyjest"
+        spec.write_text("VALUE = 1\n")
+        self.addCleanup(sys.modules.pop, "cached_spec", None)
+
+        first = _pyjest_module(spec)
+        self.assertIs(_pyjest_module(spec), first)
+
+        spec.write_text("VALUE = 22\n")
+        second = _pyjest_module(spec)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.VALUE, 22)
+
+    @test("merge_suites keeps the first copy of each test id in order")
+    def test_merge_suites_dedupes_in_order(self) -> None:
+        class Case(unittest.TestCase):
+            def test_a(self) -> None: ...
+
+            def test_b(self) -> None: ...
+
+        first = unittest.TestSuite([Case("test_b"), unittest.TestSuite([Case("test_a")])])
+        dupe = Case("test_b")
+
+        merged = list(_merge_suites([first, unittest.TestSuite([dupe])]))
+
+        self.assertEqual([t._testMethodName for t in merged], ["test_b", "test_a"])
+        self.assertFalse(any(t is dupe for t in merged))
+
+    @test("flatten_suite walks deep and empty nesting in order")
+    def test_flatten_suite_deep_nesting(self) -> None:
+        class Case(unittest.TestCase):
+            def test_a(self) -> None: ...
+
+            def test_b(self) -> None: ...
+
+        nested: unittest.TestSuite = unittest.TestSuite([Case("test_b")])
+        for _ in range(50):
+            nested = unittest.TestSuite([unittest.TestSuite(), nested])
+        suite = unittest.TestSuite([Case("test_a"), nested, Case("test_a")])
+
+        names = [t._testMethodName for t in _flatten_suite(suite)]
+
+        self.assertEqual(names, ["test_a", "test_b", "test_a"])
+
+    @test("filter_suite applies path and module filters per module")
+    def test_filter_suite_per_module(self) -> None:
+        class Case(unittest.TestCase):
+            def test_a(self) -> None: ...
+
+            def test_b(self) -> None: ...
+
+        def run(excludes=(), module_pattern=None):
+            suite = unittest.TestSuite([Case("test_a"), Case("test_b")])
+            kept = _filter_suite(
+                suite, _compile_excludes(excludes), (), test_name_pattern=None, module_pattern=module_pattern, tags=()
+            )
+            return [t._testMethodName for t in kept]
+
+        self.assertEqual(run(), ["test_a", "test_b"])
+        self.assertEqual(run(module_pattern=__name__), ["test_a", "test_b"])
+        self.assertEqual(run(module_pattern="elsewhere.*"), [])
+        self.assertEqual(run(excludes=(Path(__file__).name,)), [])
+
+    @test("module_file resolves loaded modules once and does not cache misses")
+    def test_module_file_cache(self) -> None:
+        import types
+
+        name = "pyjest_module_file_probe"
+        self.assertIsNone(_module_file(name))
+        module = types.ModuleType(name)
+        module.__file__ = str(self.root / "probe.py")
+        sys.modules[name] = module
+        self.addCleanup(sys.modules.pop, name, None)
+
+        self.assertEqual(_module_file(name), os.path.realpath(module.__file__))
+        module.__file__ = "elsewhere.py"
+        self.assertEqual(_module_file(name), os.path.realpath(self.root / "probe.py"))
+
+    @test("overlapping targets load each test once")
+    def test_load_targets_dedupes_overlapping_targets(self) -> None:
+        fixture_dir = Path(__file__).parent / "fixtures" / "basic"
+        once = _load_targets(unittest.TestLoader(), [str(fixture_dir)], "fixture_*.py")
+        twice = _load_targets(
+            unittest.TestLoader(), [str(fixture_dir), f"{fixture_dir}/", "fixture_pass"], "fixture_*.py"
+        )
+
+        self.assertEqual([t.id() for t in twice], [t.id() for t in once])
@@ -1,7 +1,16 @@
+import io
+import pickle
+import tempfile
+import threading
 import unittest
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 from pyjest import describe, test
 
+from pyjest.orchestrator import runner
 from test_pyjest_cli import _run_pyjest
 
 
@@ -21,6 +30,144 @@ class ParallelCLITests(unittest.TestCase):
         )
         self.assertEqual(result.returncode, 0, msg=result.stdout)
 
+    @test("several directory targets run in band on one loader")
+    def test_run_in_band_multiple_directories(self) -> None:
+        result = _run_pyjest(
+            [
+                "--pattern",
+                "fixture_*.py",
+                "tests/fixtures/basic",
+                "tests/fixtures/extra",
+                "--runInBand",
+            ]
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stdout)
+
+    @test("parallel failures propagate exit code")
+    def test_parallel_failures_exit_non_zero(self) -> None:
+        result = _run_pyjest(
+            [
+                "--pattern",
+                "fixture_*.py",
+                "tests/fixtures/basic",
+                "tests/fixtures/failing",
+                "--maxWorkers",
+                "2",
+            ]
+        )
+        self.assertNotEqual(result.returncode, 0, msg=result.stdout)
+        self.assertIn("[tests/fixtures/failing]", result.stdout)
+
+    @test("single directory target is sharded across workers")
+    def test_single_directory_is_sharded(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "pyproject.toml").write_text("")
+            tests_dir = Path(tmpdir) / "tests"
+            tests_dir.mkdir()
+            for name in ("alpha", "beta"):
+                (tests_dir / f"test_{name}.py").write_text(
+                    "import unittest\n\n"
+                    f"class {name.title()}Tests(unittest.TestCase):\n"
+                    "    def test_ok(self):\n"
+                    "        self.assertTrue(True)\n"
+                )
+            result = _run_pyjest(["--root", tmpdir, "tests", "--maxWorkers", "2"])
+        self.assertEqual(result.returncode, 0, msg=result.stdout)
+        self.assertIn("[tests#1]", result.stdout)
+        self.assertIn("[tests#2]", result.stdout)
+
+    @test("pool forks only from a single-threaded Linux parent")
+    def test_pool_context_choice(self) -> None:
+        with mock.patch.object(runner.sys, "platform", "linux"), mock.patch("threading.active_count", return_value=1):
+            self.assertEqual(runner._pool_context().get_start_method(), "fork")
+        with mock.patch.object(runner.sys, "platform", "linux"), mock.patch("threading.active_count", return_value=2):
+            self.assertEqual(runner._pool_context().get_start_method(), "spawn")
+        with mock.patch.object(runner.sys, "platform", "darwin"):
+            self.assertEqual(runner._pool_context().get_start_method(), "spawn")
+
+    @test("workers claim affinity sets round-robin")
+    def test_pin_worker_round_robin(self) -> None:
+        counter = mock.MagicMock(value=0)
+        with mock.patch.object(runner.os, "sched_setaffinity", create=True) as pin:
+            for _ in range(3):
+                runner._pin_worker([(0, 1), (2, 3)], counter)
+        self.assertEqual([call.args for call in pin.call_args_list], [(0, (0, 1)), (0, (2, 3)), (0, (0, 1))])
+
+    @test("worker config keeps only worker fields and survives pickling")
+    def test_worker_config_from_namespace(self) -> None:
+        args = SimpleNamespace(pattern="fixture_*.py", ignore=["build"], watch=True, maxWorkers=2)
+        config = runner.WorkerConfig.from_namespace(args)
+        self.assertEqual(config.ignore, ("build",))
+        self.assertFalse(hasattr(config, "watch"))
+        labelled = pickle.loads(pickle.dumps(replace(config, report_suffix="tests#1")))
+        self.assertEqual(labelled.report_suffix, "tests#1")
+        self.assertEqual(labelled.pattern, "fixture_*.py")
+
+    @test("worker output is labelled on non-blank lines only")
+    def test_prefix_lines(self) -> None:
+        text = "Running\n\n  \n\u280b 1\r\u2819 2\n    assert ok\nDone\n"
+        self.assertEqual(
+            runner._prefix_lines(text, "[t#1] "),
+            "[t#1] Running\n\n  \n[t#1] \u280b 1\n[t#1] \u2819 2\n[t#1]     assert ok\n[t#1] Done",
+        )
+
+    @test("streamed worker output is written in whole labelled lines")
+    def test_locked_line_stream(self) -> None:
+        sink = io.StringIO()
+        stream = runner._LockedLineStream(sink, threading.Lock(), "[w1] ")
+        stream.write("Run")
+        self.assertEqual(sink.getvalue(), "")
+        stream.write("ning\n\nDo")
+        self.assertEqual(sink.getvalue(), "[w1] Running\n\n")
+        stream.write("ne")
+        stream.close()
+        self.assertEqual(sink.getvalue(), "[w1] Running\n\n[w1] Done\n")
+
+    @test("flushing streamed worker output keeps partial lines together")
+    def test_locked_line_stream_flush_keeps_partial_line(self) -> None:
+        sink = io.StringIO()
+        stream = runner._LockedLineStream(sink, threading.Lock(), "[w1] ")
+        for _ in range(3):
+            stream.write("\u2713 ")
+            stream.flush()
+        self.assertEqual(sink.getvalue(), "")
+        stream.write("\n")
+        stream.write("tail\n")
+        stream.close()
+        self.assertEqual(sink.getvalue(), "[w1] \u2713 \u2713 \u2713 \n[w1] tail\n")
+
+    @test("large worker transcripts spill to a file the parent copies and removes")
+    def test_worker_output_spills_past_limit(self) -> None:
+        capture = tempfile.SpooledTemporaryFile(max_size=16, mode="w+", encoding="utf-8", newline="")
+        capture.write("Running\n\n" + "x" * 32 + "\n")
+        with mock.patch.object(runner, "_SPOOL_LIMIT", 16):
+            text, path = runner._drain_capture(capture, "[w1] ")
+        capture.close()
+        self.assertEqual(text, "")
+        self.assertTrue(Path(path).exists())
+
+        sink = io.StringIO()
+        runner._write_worker_output(sink, runner.SuiteSummary(True, [], None, None, text, path))
+        self.assertEqual(sink.getvalue(), "[w1] Running\n\n[w1] " + "x" * 32 + "\n")
+        self.assertFalse(Path(path).exists())
+
+    @test("parallel stream flag prints worker lines directly")
+    def test_parallel_stream_cli(self) -> None:
+        result = _run_pyjest(
+            [
+                "--pattern",
+                "fixture_*.py",
+                "tests/fixtures/basic",
+                "tests/fixtures/extra",
+                "--maxWorkers",
+                "2",
+                "--parallel-stream",
+            ]
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stdout)
+        self.assertIn("[tests/fixtures/basic]   Tests:", result.stdout)
+        self.assertIn("[tests/fixtures/extra]   Tests:", result.stdout)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 import io
 import json
+import gc
 import tempfile
 import unittest
+import weakref
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from types import SimpleNamespace
@@ -36,7 +38,7 @@ class ReportingOutputTests(unittest.TestCase):
             result.failures = [("x", "y")]
             result.errors = []
             result.skipped = []
-            result._successes = []
+            result.success_count = 0
 
             args = SimpleNamespace(report_format=["json", "tap", "junit", "console"], root=tmpdir, report_suffix="worker/1")
             reporting.emit_reports(result, coverage_percent=12.3, duration=0.25, args=args)
@@ -63,6 +65,26 @@ class ReportingOutputTests(unittest.TestCase):
             self.assertIsNotNone(failure)
             self.assertIn("boom", failure.text or "")
 
+    @test("counts passing tests without keeping their instances alive")
+    def test_result_drops_passing_tests(self) -> None:
+        class Passing(unittest.TestCase):
+            def test_ok(self) -> None:
+                pass
+
+            def test_bad(self) -> None:
+                self.fail("boom")
+
+        result = JestStyleResult(stream=io.StringIO(), descriptions=False, verbosity=1)
+        result.spinner_enabled = False
+        suite = unittest.TestSuite([Passing("test_ok"), Passing("test_bad")])
+        passing = weakref.ref(suite._tests[0])
+        suite.run(result)
+        gc.collect()
+
+        self.assertEqual(result.success_count, 1)
+        self.assertIsNone(passing())
+        self.assertEqual(result.failures[0][0].id().rsplit(".", 1)[-1], "test_bad")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,82 @@
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+import unittest
+from unittest import mock
+
+from pyjest import describe, test
+from pyjest.orchestrator import run_once
+
+
+@describe("Single-run orchestration helpers")
+class RunOnceHelperTests(unittest.TestCase):
+    @test("last-failed ids round-trip as lines and legacy JSON still loads")
+    def test_last_failed_file_format(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            ids = ["pkg.test_a.Case.test_one", "pkg.test_b.Case.test_two"]
+            run_once._persist_last_failed(root, ids)
+            self.assertEqual((root / run_once.LAST_FAILED_FILE).read_text(), "\n".join(ids))
+            self.assertEqual(sorted(p.name for p in root.iterdir()), [run_once.LAST_FAILED_FILE])
+
+            args = SimpleNamespace(last_failed=True, root=root, targets=["tests"])
+            run_once._maybe_apply_last_failed(args)
+            self.assertEqual(args.targets, ids)
+
+            (root / run_once.LAST_FAILED_FILE).write_text('["legacy.Case.test"]')
+            run_once._maybe_apply_last_failed(args)
+            self.assertEqual(args.targets, ["legacy.Case.test"])
+
+    @test("reruns reuse the failed test instances and collapse subtests")
+    def test_rerun_suite_reuses_failed_instances(self) -> None:
+        class Flaky(unittest.TestCase):
+            def test_sub(self) -> None:
+                for value in (1, 2):
+                    with self.subTest(value=value):
+                        self.fail("flaky")
+
+            def test_ok(self) -> None:
+                pass
+
+        result = unittest.TestResult()
+        unittest.TestLoader().loadTestsFromTestCase(Flaky).run(result)
+        self.assertEqual(len(result.failures), 2)
+
+        loader = mock.Mock()
+        suite = run_once._rerun_suite(loader, result)
+
+        self.assertEqual([t.id() for t in suite], [f"{Flaky.__module__}.{Flaky.__qualname__}.test_sub"])
+        self.assertIs(list(suite)[0], result.failures[0][0].test_case)
+        loader.loadTestsFromName.assert_not_called()
+
+
+    @test("reruns reload the class behind a failed setUpClass")
+    def test_rerun_suite_reloads_fixture_scope(self) -> None:
+        module = ModuleType("pyjest_temp_rerun_fixture")
+        sys.modules[module.__name__] = module
+        self.addCleanup(sys.modules.pop, module.__name__, None)
+
+        class Fixture(unittest.TestCase):
+            @classmethod
+            def setUpClass(cls) -> None:
+                raise RuntimeError("fixture down")
+
+            def test_one(self) -> None:
+                pass
+
+        Fixture.__module__ = module.__name__
+        Fixture.__qualname__ = "Fixture"
+        module.Fixture = Fixture
+        result = unittest.TestResult()
+        unittest.TestLoader().loadTestsFromTestCase(Fixture).run(result)
+        self.assertEqual(result.errors[0][0].id(), "setUpClass (pyjest_temp_rerun_fixture.Fixture)")
+
+        suite = run_once._rerun_suite(unittest.TestLoader(), result)
+
+        ids = [t.id() for scope in suite for t in scope]
+        self.assertEqual(ids, ["pyjest_temp_rerun_fixture.Fixture.test_one"])
+
+
+if __name__ == "__main__":
+    unittest.main()
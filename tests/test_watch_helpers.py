@@ -1,5 +1,8 @@
+import os
+import queue
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from types import SimpleNamespace, ModuleType
 import unittest
@@ -43,14 +46,147 @@ class WatchHelperTests(unittest.TestCase):
         targets = watch.targets_from_changed(set(), ["default"])
         self.assertEqual(targets, ["default"])
 
-    @test("diff snapshot detects added removed and changed files")
-    def test_diff_snapshots(self) -> None:
-        prev = {Path("a.py"): 1.0, Path("b.py"): 2.0}
-        current = {Path("a.py"): 1.0, Path("c.py"): 3.0}
+    @test("refresh snapshot updates in place and reports edits, additions and removals")
+    def test_refresh_snapshot_in_place(self) -> None:
+        root = Path(self._tmpdir.name)
+        kept = root / "kept.py"
+        gone = root / "gone.py"
+        kept.write_text("a = 1\n")
+        gone.write_text("")
+        (root / ".hidden").mkdir()
+        (root / ".hidden" / "skip.py").write_text("")
+        snapshot = watch.snapshot_watchable_files(root)
+        self.assertEqual(set(snapshot), {str(kept), str(gone)})
+
+        kept.write_text("a = 22\n")
+        gone.unlink()
+        added = root / "added.pyjest"
+        added.write_text("")
+
+        changed = watch._refresh_snapshot(snapshot, root)
+
+        self.assertEqual(changed, {kept, gone, added})
+        self.assertEqual(set(snapshot), {str(kept), str(added)})
+        self.assertEqual(watch._refresh_snapshot(snapshot, root), set())
+
+    @test("force poll bypasses the native watcher")
+    def test_force_poll_uses_snapshot_polling(self) -> None:
+        root = Path(self._tmpdir.name)
+        snapshot = watch.snapshot_watchable_files(root)
+        added = root / "new.py"
+        added.write_text("")
+        with unittest.mock.patch.object(watch_loop, "has_native_debounce", return_value=True), \
+                unittest.mock.patch.object(watch_loop, "next_change") as native:
+            changed, _ = watch_loop._wait_for_change(snapshot, root, 0.01, 0.0, force_poll=True)
+        native.assert_not_called()
+        self.assertEqual(changed, {added})
+
+    @test("only added or removed files forget the cached test layout")
+    def test_layout_forgotten_on_structural_change(self) -> None:
+        root = Path(self._tmpdir.name)
+        kept = root / "kept.py"
+        kept.write_text("")
+        args = SimpleNamespace(watch_interval=0.01, watch_debounce=0.0, force_poll=True)
+        ctx = watch_loop.WatchContext(root=root, loader=None, snapshot=watch.snapshot_watchable_files(root), targets=[])
+
+        def wait_after(edit):
+            def fake_wait(snapshot, *_):
+                edit()
+                return watch._refresh_snapshot(snapshot, root), snapshot
+            return fake_wait
+
+        edit = wait_after(lambda: kept.write_text("x = 1\n"))
+        add = wait_after(lambda: (root / "new.py").write_text(""))
+        with unittest.mock.patch.object(watch_loop, "_forget_layout") as forget:
+            with unittest.mock.patch.object(watch_loop, "_wait_for_change", edit):
+                watch_loop._sleep_until_change(ctx, args)
+            forget.assert_not_called()
+            with unittest.mock.patch.object(watch_loop, "_wait_for_change", add):
+                watch_loop._sleep_until_change(ctx, args)
+            forget.assert_called_once_with()
+
+    @test("backend events update the snapshot without walking the tree")
+    def test_apply_events_updates_snapshot(self) -> None:
+        root = Path(self._tmpdir.name)
+        kept = root / "kept.py"
+        kept.write_text("")
+        gone = root / "gone.py"
+        gone.write_text("")
+        snapshot = watch.snapshot_watchable_files(root)
+        kept.write_text("x = 1\n")
+        gone.unlink()
+        added = root / "added.pyjest"
+        added.write_text("")
+        (root / ".cache").mkdir()
+        hidden = root / ".cache" / "tmp.py"
+        hidden.write_text("")
+        notes = root / "notes.txt"
+        notes.write_text("")
+
+        with unittest.mock.patch.object(watch, "_refresh_snapshot") as walk:
+            changed = watch._apply_events(snapshot, root, {kept, gone, added, hidden, notes, root / "never.py"})
+
+        walk.assert_not_called()
+        self.assertEqual(changed, {kept, gone, added})
+        self.assertEqual(snapshot, watch.snapshot_watchable_files(root))
+
+    @test("native watcher batches with no real change keep waiting")
+    def test_next_change_skips_empty_watchfiles_batches(self) -> None:
+        root = Path(self._tmpdir.name)
+        kept = root / "kept.py"
+        kept.write_text("")
+        snapshot = watch.snapshot_watchable_files(root)
+        batches = iter([{root / "flicker.py"}, {kept}])
+
+        def fake_wait(*_):
+            batch = next(batches)
+            if kept in batch:
+                kept.write_text("x = 1\n")
+            return batch
+
+        with unittest.mock.patch.object(watch, "HAS_WATCHFILES", True), \
+                unittest.mock.patch.object(watch, "_watchfiles_wait", side_effect=fake_wait):
+            changed, _ = watch.next_change(snapshot, root, 0.01)
+
+        self.assertEqual(changed, {kept})
+
+    @test("watcher events are coalesced until the debounce window stays quiet")
+    def test_drain_events_coalesces_burst(self) -> None:
+        events = queue.Queue()
+        events.put(Path("a.py"))
+        late = threading.Timer(0.02, events.put, args=(Path("b.py"),))
+        late.start()
+        self.addCleanup(late.cancel)
+
+        self.assertEqual(watch._drain_events(events, 1.0, 0.2), {Path("a.py"), Path("b.py")})
+        self.assertEqual(watch._drain_events(events, 0.01, 0.0), set())
+
+    @test("idle polling backs off to the interval and resets after a wake")
+    def test_polling_backoff(self) -> None:
+        rescans = iter([set(), set(), set(), set(), set(), {Path("a.py")}])
+        wakes = iter([False, False, False, True, False])
+        pauses = []
+
+        def fake_pause(seconds):
+            pauses.append(seconds)
+            return next(wakes)
 
-        changed = watch._diff_snapshots(prev, current)
+        with unittest.mock.patch.object(watch_loop, "_refresh_snapshot", side_effect=lambda *_: next(rescans)), \
+                unittest.mock.patch.object(watch_loop, "_pause", side_effect=fake_pause):
+            changed, _ = watch_loop._wait_until_changed({}, Path("."), 0.8)
 
-        self.assertEqual(changed, {Path("b.py"), Path("c.py")})
+        self.assertEqual(changed, {Path("a.py")})
+        self.assertEqual(pauses, [0.1, 0.2, 0.4, 0.8, 0.1])
+
+    @test("a byte on the wake pipe ends the pause early")
+    def test_pause_wakes_on_pipe(self) -> None:
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        with unittest.mock.patch.object(watch_loop, "_WAKE_FD", read_fd):
+            self.assertFalse(watch_loop._pause(0.01))
+            os.write(write_fd, b"\x0a")
+            self.assertTrue(watch_loop._pause(5))
 
     @test("next targets prefer onlyChanged and failures when configured")
     def test_next_targets_prefers_flags(self) -> None:
@@ -89,6 +225,52 @@ class WatchHelperTests(unittest.TestCase):
 
         self.assertEqual(targets, ["heuristic.target"])
 
+    @test("watch iterations reuse one coverage object")
+    def test_watch_reuses_coverage(self) -> None:
+        from pyjest.orchestrator import runner
+
+        cov = unittest.mock.Mock()
+        args = SimpleNamespace(coverage=True, root=Path(self._tmpdir.name))
+        with unittest.mock.patch.object(runner, "make_coverage") as make_coverage:
+            started = runner._start_coverage_if_needed(args, cov)
+
+        self.assertIs(started, cov)
+        make_coverage.assert_not_called()
+        cov.erase.assert_called_once_with()
+        cov.start.assert_called_once_with()
+
+    @test("failed modules dedupe and name a subtest's own module")
+    def test_failed_modules_unwraps_subtests(self) -> None:
+        from pyjest.orchestrator import runner
+
+        class Failing(unittest.TestCase):
+            def test_sub(self) -> None:
+                for value in (1, 2):
+                    with self.subTest(value=value):
+                        self.fail("boom")
+
+            def test_plain(self) -> None:
+                self.fail("boom")
+
+        result = unittest.TestResult()
+        unittest.TestLoader().loadTestsFromTestCase(Failing).run(result)
+
+        self.assertEqual(runner.failed_modules(result), [__name__])
+        self.assertEqual(len(runner.failing_test_ids(result)), 3)
+
+    @test("coverage tracing stops when a watch run is interrupted")
+    def test_coverage_scope_stops_on_interrupt(self) -> None:
+        from pyjest.orchestrator import runner
+
+        cov = unittest.mock.Mock()
+        args = SimpleNamespace(coverage=True, root=Path(self._tmpdir.name))
+        with self.assertRaises(KeyboardInterrupt):
+            with runner._coverage_scope(args, cov):
+                raise KeyboardInterrupt
+
+        cov.stop.assert_called_once_with()
+        cov.save.assert_not_called()
+
 
 @describe("Change-to-target mapping")
 class ChangeMapTests(unittest.TestCase):
@@ -131,3 +313,31 @@ class ChangeMapTests(unittest.TestCase):
 
         self.assertIn("pyjest_temp_app", targets)
         self.assertNotIn("fallback", targets)
+
+    @test("import graph parses project modules with ast and skips outside ones")
+    def test_import_graph_uses_ast_for_project_modules(self) -> None:
+        from pyjest import change_map
+
+        root = Path(self._tmpdir.name)
+        app_path = root / "pyjest_temp_graph_app.py"
+        app_path.write_text("from pkg_one.sub import (\n    a,\n    b,\n)\nimport pkg_two.x, pkg_three\nfrom . import local\n")
+        app_module = ModuleType("pyjest_temp_graph_app")
+        app_module.__file__ = str(app_path)
+        sys.modules["pyjest_temp_graph_app"] = app_module
+        self.addCleanup(sys.modules.pop, "pyjest_temp_graph_app", None)
+
+        graph = change_map._import_graph_from_modules(["pyjest_temp_graph_app", "unittest"], root)
+
+        self.assertEqual(graph, {"pyjest_temp_graph_app": {"pkg_one", "pkg_two", "pkg_three"}})
+
+    @test("fallback import scan skips docstrings and stops after the import block")
+    def test_scan_import_lines_stops_early(self) -> None:
+        from pyjest import change_map
+
+        path = Path(self._tmpdir.name) / "broken_module.py"
+        body = ['"""Module doc.', "", "import not_an_import_inside_doc", '"""', "import early_dep", "def broken(:"]
+        body += [f"x{i} = {i}" for i in range(change_map._IMPORT_SCAN_SLACK)]
+        body.append("import late_dep")
+        path.write_text("\n".join(body) + "\n")
+
+        self.assertEqual(change_map._read_imports(str(path)), {"early_dep"})